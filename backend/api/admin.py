@@ -26,16 +26,19 @@ class OTPAdmin(admin.ModelAdmin):
 @admin.register(ChatSession)
 class ChatSessionAdmin(admin.ModelAdmin):
     list_display = ['user', 'title', 'created_at']
+    list_select_related = ['user']
     search_fields = ['user__phone_number', 'title']
 
 @admin.register(ChatMessage)
 class ChatMessageAdmin(admin.ModelAdmin):
     list_display = ['session', 'role', 'created_at']
+    list_select_related = ['session__user']
     list_filter = ['role']
 
 @admin.register(UserDocument)
 class UserDocumentAdmin(admin.ModelAdmin):
     list_display = ['user', 'file_name', 'status', 'created_at']
+    list_select_related = ['user']
     list_filter = ['status', 'file_type']
 
 
@@ -50,6 +53,7 @@ class PublicDocumentAdmin(admin.ModelAdmin):
         'jurisdiction', 'created_at'
     ]
     search_fields = ['title', 'uploaded_by__phone_number']
+    list_select_related = ['uploaded_by']
     readonly_fields = ['entities_extracted', 'relationships_count', 'embeddings_count']
     fieldsets = (
         ('Basic Information', {
@@ -79,6 +83,7 @@ class ProcessingTaskAdmin(admin.ModelAdmin):
         ('completed_at', admin.DateFieldListFilter)
     ]
     search_fields = ['task_id', 'user__phone_number', 'public_document__title', 'user_document__file_name']
+    list_select_related = ['user', 'public_document', 'user_document']
     readonly_fields = [
         'task_id', 'processing_time_seconds', 'entities_extracted', 
         'embeddings_created', 'created_at', 'started_at', 'completed_at',
@@ -234,14 +239,18 @@ class ProcessingTaskAdmin(admin.ModelAdmin):
         last_24h = now - timedelta(hours=24)
         last_7d = now - timedelta(days=7)
         
-        # Recent task counts
-        recent_tasks = ProcessingTask.objects.filter(created_at__gte=last_24h)
+        # Recent task counts in one aggregated query instead of five
+        status_counts = dict(
+            ProcessingTask.objects.filter(created_at__gte=last_24h)
+            .values_list('status')
+            .annotate(n=Count('id'))
+        )
         task_stats = {
-            'total_24h': recent_tasks.count(),
-            'queued': recent_tasks.filter(status='queued').count(),
-            'processing': recent_tasks.filter(status='processing').count(),
-            'completed': recent_tasks.filter(status='completed').count(),
-            'failed': recent_tasks.filter(status='failed').count(),
+            'total_24h': sum(status_counts.values()),
+            'queued': status_counts.get('queued', 0),
+            'processing': status_counts.get('processing', 0),
+            'completed': status_counts.get('completed', 0),
+            'failed': status_counts.get('failed', 0),
         }
         
         # Average processing times
@@ -285,5 +294,6 @@ class UserPartitionAdmin(admin.ModelAdmin):
         'total_embeddings', 'last_accessed'
     ]
     search_fields = ['user__phone_number', 'partition_name']
+    list_select_related = ['user']
     readonly_fields = ['partition_name', 'created_at']
     list_filter = ['created_at', 'last_accessed']
\ No newline at end of file
@@ -435,7 +435,11 @@ def delete_public_document(request, document_id):
                 # Log but don't fail the deletion
                 print(f"Warning: Could not delete file {document.file_path.name}: {e}")
         
-        # Delete document (will cascade to processing tasks)
+        # Wipe dependent tasks with one DELETE so the cascade collector
+        # doesn't have to fetch and fan out over them row by row
+        ProcessingTask.objects.filter(public_document=document).delete()
+
+        # Delete document
         document.delete()
         
         return Response({
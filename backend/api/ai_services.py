@@ -12,6 +12,7 @@ from django.conf import settings
 from django.core.cache import cache
 from sentence_transformers import SentenceTransformer, CrossEncoder
 from pymilvus import connections, Collection, utility
+import numpy as np
 import neo4j
 import groq
 import PyPDF2
@@ -89,19 +90,26 @@ class AIServiceManager:
             raise
 
     @lru_cache(maxsize=1000)
-    def get_embeddings(self, text: str) -> List[float]:
-        """Get embeddings for text with caching"""
+    def get_embeddings(self, text: str) -> np.ndarray:
+        """Get embeddings for text with caching
+
+        Returned as a float32 ndarray end to end — Milvus takes arrays
+        directly, so there is no tolist() round-trip boxing 768 floats,
+        and the shared cache stores the raw buffer instead of a pickled
+        list.
+        """
         if not self._initialized:
             self.initialize()
-        
+
         cache_key = f"embedding:{hash(text)}"
         cached_embedding = cache.get(cache_key)
-        
-        if cached_embedding:
-            return cached_embedding
-        
-        embedding = self.embedding_model.encode(text).tolist()
-        cache.set(cache_key, embedding, timeout=3600)  # Cache for 1 hour
+
+        if cached_embedding is not None:
+            return np.frombuffer(cached_embedding, dtype=np.float32)
+
+        embedding = self.embedding_model.encode(text, convert_to_numpy=True)
+        embedding = embedding.astype(np.float32, copy=False)
+        cache.set(cache_key, embedding.tobytes(), timeout=3600)  # Cache for 1 hour
         return embedding
 
 # Global AI service manager instance
@@ -76,14 +76,16 @@ class AuthService:
     def verify_otp(phone_number: str, otp_code: str):
         """Verify OTP and authenticate user"""
         try:
-            # Find valid OTP
+            # Find valid OTP; filtering expiry in SQL hits the partial
+            # index over unverified, not-yet-expired rows
             otp_obj = OTP.objects.filter(
                 phone_number=phone_number,
                 otp=otp_code,
-                is_verified=False
+                is_verified=False,
+                expires_at__gt=timezone.now()
             ).first()
             
-            if not otp_obj or not otp_obj.is_valid():
+            if not otp_obj:
                 return {'success': False, 'error': 'Invalid or expired OTP'}
             
             # Mark OTP as verified
@@ -5,6 +5,7 @@ from typing import List, Dict, Any, Optional
 from django.conf import settings
 from django.core.cache import cache
 from pymilvus import connections, Collection, utility, FieldSchema, CollectionSchema, DataType
+import numpy as np
 import neo4j
 import redis
 
@@ -117,8 +118,8 @@ class MilvusManager:
             # Create index
             index_params = {
                 "metric_type": "COSINE",
-                "index_type": "IVF_FLAT",
-                "params": {"nlist": 128}
+                "index_type": "IVF_SQ8",  # 8-bit scalar quantization in-index
+                "params": {"nlist": 1024}
             }
             collection.create_index("embedding", index_params)
             
@@ -141,7 +142,7 @@ class MilvusManager:
             logger.error(f"Failed to insert documents: {e}")
             return False
     
-    def search_vectors(self, collection_name: str, query_embedding: List[float], 
+    def search_vectors(self, collection_name: str, query_embedding: np.ndarray,
                       top_k: int = 10, filters: Optional[str] = None) -> List[Dict]:
         """Search vectors in collection"""
         try:
@@ -186,10 +187,30 @@ class MilvusManager:
 
 class Neo4jManager:
     """Manages Neo4j graph database operations"""
-    
+
+    # Below this limit the scan is too small for the parallel runtime's
+    # startup cost to pay off
+    PARALLEL_RUNTIME_MIN_LIMIT = 50
+
     def __init__(self):
         self.driver = None
         self.connected = False
+        self._parallel_runtime_unavailable = False
+
+    def _run_read_query(self, session, query: str, params: Dict[str, Any], limit: int) -> List:
+        """Run a read-only query, preferring the parallel runtime for large scans
+
+        Community edition and pre-5.13 servers reject the runtime hint;
+        the first rejection flips a flag so every later query goes
+        straight to the default runtime.
+        """
+        if limit >= self.PARALLEL_RUNTIME_MIN_LIMIT and not self._parallel_runtime_unavailable:
+            try:
+                return list(session.run("CYPHER runtime=parallel " + query, params))
+            except Exception as e:
+                self._parallel_runtime_unavailable = True
+                logger.warning(f"Parallel runtime unavailable, using default runtime: {e}")
+        return list(session.run(query, params))
     
     def connect(self):
         """Connect to Neo4j"""
@@ -245,6 +266,27 @@ class Neo4jManager:
         except Exception as e:
             logger.error(f"Failed to create document node: {e}")
     
+    def create_document_nodes(self, rows: List[Dict[str, Any]], batch_size: int = 200):
+        """Create document nodes in batches, one UNWIND statement per transaction"""
+        try:
+            query = """
+            UNWIND $rows AS r
+            MERGE (d:Document {document_id: r.document_id})
+            SET d.user_id = r.user_id,
+                d.title = r.title,
+                d.content = r.content,
+                d.document_type = r.document_type,
+                d.created_at = r.created_at,
+                d.metadata = r.metadata
+            """
+            with self.driver.session() as session:
+                for start in range(0, len(rows), batch_size):
+                    session.run(query, {'rows': rows[start:start + batch_size]})
+            logger.info(f"Created {len(rows)} document nodes in batches of {batch_size}")
+
+        except Exception as e:
+            logger.error(f"Failed to create document nodes: {e}")
+
     def query_entities(self, filters: Dict[str, Any], limit: int = 10) -> List[Dict]:
         """Query entities from graph"""
         try:
@@ -257,11 +299,11 @@ class Neo4jManager:
                 LIMIT $limit
                 """
                 
-                result = session.run(query, {
+                result = self._run_read_query(session, query, {
                     'name': filters.get('name', ''),
                     'limit': limit
-                })
-                
+                }, limit)
+
                 entities = []
                 for record in result:
                     node = record['n']
@@ -273,6 +315,48 @@ class Neo4jManager:
             logger.error(f"Entity query failed: {e}")
             return []
     
+    def query_entities_with_related(self, names: List[str], per_entity_limit: int = 10) -> List[Dict]:
+        """Query several entities and their outgoing relationships in one round-trip
+
+        One UNWIND statement replaces the per-entity query_entities +
+        query_relationships pairs, so the driver pays a single network
+        round-trip regardless of how many names are searched.
+        """
+        try:
+            with self.driver.session() as session:
+                query = """
+                UNWIND $names AS name
+                CALL {
+                    WITH name
+                    MATCH (n)
+                    WHERE n.name CONTAINS name
+                    OPTIONAL MATCH (n)-[r]->(target)
+                    RETURN n, r, target
+                    LIMIT $limit
+                }
+                RETURN name, n, r, target
+                """
+
+                result = self._run_read_query(session, query, {
+                    'names': names,
+                    'limit': per_entity_limit
+                }, per_entity_limit * max(len(names), 1))
+
+                rows = []
+                for record in result:
+                    rows.append({
+                        'name': record['name'],
+                        'entity': dict(record['n']),
+                        'relationship': dict(record['r']) if record['r'] is not None else None,
+                        'target': dict(record['target']) if record['target'] is not None else None
+                    })
+
+                return rows
+
+        except Exception as e:
+            logger.error(f"Batched entity query failed: {e}")
+            return []
+
     def query_relationships(self, source_id: str, limit: int = 10) -> List[Dict]:
         """Query relationships from source entity"""
         try:
@@ -284,11 +368,11 @@ class Neo4jManager:
                 LIMIT $limit
                 """
                 
-                result = session.run(query, {
+                result = self._run_read_query(session, query, {
                     'source_id': source_id,
                     'limit': limit
-                })
-                
+                }, limit)
+
                 relationships = []
                 for record in result:
                     relationships.append({
@@ -347,7 +431,7 @@ class DatabaseManager:
         """Initialize all database connections"""
         self.connection_pool.initialize()
     
-    def search_vectors(self, query_embedding: List[float], user, 
+    def search_vectors(self, query_embedding: np.ndarray, user,
                       include_public: bool = True, top_k: int = 10) -> List[Dict]:
         """Search vectors across collections"""
         results = []
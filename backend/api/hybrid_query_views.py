@@ -460,20 +460,20 @@ def _save_to_chat_session(user: User, session_id: str, query: str, response_data
             defaults={'title': query[:50] + '...' if len(query) > 50 else query}
         )
         
-        # Save user message
-        user_message = ChatMessage.objects.create(
-            session=chat_session,
-            role='user',
-            content=query
-        )
-        
-        # Save assistant response
+        # Save user message and assistant response with one INSERT
         assistant_content = response_data.get('response', 'No response generated')
-        assistant_message = ChatMessage.objects.create(
-            session=chat_session,
-            role='assistant',
-            content=assistant_content
-        )
+        ChatMessage.objects.bulk_create([
+            ChatMessage(
+                session=chat_session,
+                role='user',
+                content=query
+            ),
+            ChatMessage(
+                session=chat_session,
+                role='assistant',
+                content=assistant_content
+            ),
+        ], batch_size=500)
         
         # Update session timestamp
         chat_session.save()  # This will update the updated_at field
@@ -0,0 +1,35 @@
+# Composite indexes for the hot query patterns on chat, document and OTP
+# tables. ProcessingTask has no migration history yet, so its index
+# changes live in the model definition only.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_uuid7_defaults'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(fields=['session', 'created_at'], name='chat_msg_session_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userdocument',
+            index=models.Index(fields=['user', '-created_at'], name='user_doc_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userdocument',
+            index=models.Index(fields=['user', 'status'], name='user_doc_user_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(fields=['phone_number', '-created_at'], name='otp_phone_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(fields=['phone_number', 'is_verified', 'expires_at'], name='otp_phone_valid_idx'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Indexes for OTP expiry filtering, plus a Postgres partial index that
+# keeps only unverified OTPs — the rows verification actually touches.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(fields=['expires_at'], name='otp_expires_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='otp',
+            index=models.Index(fields=['phone_number', 'otp'], name='otp_phone_otp_idx'),
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS otp_active_idx "
+                "ON otps (phone_number, expires_at) WHERE is_verified = false;"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS otp_active_idx;",
+        ),
+    ]
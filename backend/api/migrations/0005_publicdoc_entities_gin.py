@@ -0,0 +1,33 @@
+# GIN index over PublicDocument.entities_extracted so admin containment
+# filters on the JSON payload become index lookups instead of full scans.
+# Postgres-only: SQLite (the dev database) has no GIN access method, so
+# the index is created conditionally. jsonb_path_ops keeps the index
+# small and covers the @> containment operator the filters use.
+
+from django.db import migrations
+
+
+def create_entities_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS publicdoc_entities_gin "
+        "ON public_documents USING gin (entities_extracted jsonb_path_ops);"
+    )
+
+
+def drop_entities_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS publicdoc_entities_gin;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_otp_expiry_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_entities_gin_index, drop_entities_gin_index),
+    ]
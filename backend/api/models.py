@@ -1,8 +1,30 @@
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.utils import timezone
+import secrets
+import time
 import uuid
 
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUIDv7 (RFC 9562).
+
+    Layout: 48-bit Unix millisecond timestamp, 4-bit version, 12 random
+    bits, 2-bit variant, 62 random bits. Time-ordered primary keys keep
+    inserts at the hot end of the B-tree index instead of fragmenting it
+    the way random uuid4 keys do on write-heavy tables.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = secrets.randbits(74)
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    value |= 0x7 << 76  # version 7
+    value |= ((rand >> 62) & 0xFFF) << 64
+    value |= 0x2 << 62  # RFC 4122 variant
+    value |= rand & 0x3FFFFFFFFFFFFFFF
+    return uuid.UUID(int=value)
+
+
 class UserManager(BaseUserManager):
     """Custom user manager for phone-based authentication"""
     
@@ -26,7 +48,7 @@ class UserManager(BaseUserManager):
 class User(AbstractBaseUser, PermissionsMixin):
     """Custom User model with phone authentication"""
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     phone_number = models.CharField(max_length=15, unique=True)
     name = models.CharField(max_length=255, blank=True)
     email = models.EmailField(blank=True, null=True)
@@ -64,6 +86,13 @@ class OTP(models.Model):
     class Meta:
         db_table = 'otps'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['phone_number', '-created_at'], name='otp_phone_created_idx'),
+            # Covers the is_valid lookup during verification
+            models.Index(fields=['phone_number', 'is_verified', 'expires_at'], name='otp_phone_valid_idx'),
+            models.Index(fields=['expires_at'], name='otp_expires_at_idx'),
+            models.Index(fields=['phone_number', 'otp'], name='otp_phone_otp_idx'),
+        ]
     
     def is_valid(self):
         return timezone.now() < self.expires_at and not self.is_verified
@@ -75,7 +104,7 @@ class OTP(models.Model):
 class ChatSession(models.Model):
     """Chat session for a user"""
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='chat_sessions')
     title = models.CharField(max_length=255, default="New Conversation")
     created_at = models.DateTimeField(auto_now_add=True)
@@ -97,7 +126,7 @@ class ChatMessage(models.Model):
         ('assistant', 'Assistant'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     session = models.ForeignKey(ChatSession, on_delete=models.CASCADE, related_name='messages')
     role = models.CharField(max_length=10, choices=ROLE_CHOICES)
     content = models.TextField()
@@ -106,6 +135,11 @@ class ChatMessage(models.Model):
     class Meta:
         db_table = 'chat_messages'
         ordering = ['created_at']
+        indexes = [
+            # Matches the conversation listing query:
+            # WHERE session_id = ? ORDER BY created_at
+            models.Index(fields=['session', 'created_at'], name='chat_msg_session_created_idx'),
+        ]
     
     def __str__(self):
         return f"{self.role}: {self.content[:50]}"
@@ -121,7 +155,7 @@ class UserDocument(models.Model):
         ('failed', 'Failed'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='documents')
     
     file_name = models.CharField(max_length=255)
@@ -140,6 +174,10 @@ class UserDocument(models.Model):
     class Meta:
         db_table = 'user_documents'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at'], name='user_doc_user_created_idx'),
+            models.Index(fields=['user', 'status'], name='user_doc_user_status_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.phone_number} - {self.file_name}"
@@ -173,7 +211,7 @@ class PublicDocument(models.Model):
         ('other', 'Other'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     title = models.CharField(max_length=500)
     document_type = models.CharField(max_length=100, choices=DOCUMENT_TYPE_CHOICES)
     file_path = models.FileField(upload_to='public_documents/%Y/%m/%d/')
@@ -229,7 +267,7 @@ class ProcessingTask(models.Model):
         ('system_maintenance', 'System Maintenance'),
     ]
     
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     task_id = models.CharField(max_length=255, unique=True)  # Celery task ID
     task_type = models.CharField(max_length=50, choices=TASK_TYPE_CHOICES)
     
@@ -268,9 +306,9 @@ class ProcessingTask(models.Model):
         db_table = 'processing_tasks'
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['task_type']),
-            models.Index(fields=['status']),
-            models.Index(fields=['user']),
+            # Composite indexes matching the dominant query patterns
+            models.Index(fields=['user', 'status', '-created_at'], name='task_user_status_created_idx'),
+            models.Index(fields=['status', 'task_type'], name='task_status_type_idx'),
         ]
     
     def __str__(self):
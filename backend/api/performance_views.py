@@ -3,11 +3,15 @@ API views for performance monitoring and cache management.
 Provides endpoints for system health, performance metrics, and cache control.
 """
 
+import hashlib
+import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from typing import Dict, Any
 
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
 from django.views.decorators.http import require_http_methods
 from django.contrib.admin.views.decorators import staff_member_required
 from django.utils.decorators import method_decorator
@@ -24,6 +28,48 @@ from .cache_invalidation import CacheInvalidationManager, invalidate_cache_for_u
 
 logger = logging.getLogger(__name__)
 
+# System metrics snapshot shared across polls within a short window, so
+# dashboard/health polling costs O(1) psutil reads per second
+_METRICS_SNAPSHOT_TTL = 1.0
+_metrics_snapshot = None
+_metrics_snapshot_at = 0.0
+
+
+def _etag_response(request, payload, status_code=status.HTTP_200_OK):
+    """
+    Return the payload with a content-derived ETag, or 304 when the
+    client already holds the current version.
+
+    The dashboard polls these endpoints every few seconds; between metric
+    flushes the payloads are identical, so matching If-None-Match lets
+    the client skip re-downloading and re-rendering an unchanged window.
+    """
+    body = json.dumps(payload, sort_keys=True, default=str)
+    etag = f'"{hashlib.sha256(body.encode()).hexdigest()}"'
+
+    if request.headers.get('If-None-Match') == etag:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(payload, status=status_code)
+    response['ETag'] = etag
+    return response
+
+
+def _collect_system_metrics_cached():
+    """
+    Return performance_monitor._collect_system_metrics(), memoized for
+    _METRICS_SNAPSHOT_TTL seconds. Collecting metrics shells out to psutil
+    (CPU, memory, disk), which is wasteful when health endpoints and the
+    dashboard poll every second.
+    """
+    global _metrics_snapshot, _metrics_snapshot_at
+    now = time.monotonic()
+    if _metrics_snapshot is None or now - _metrics_snapshot_at > _METRICS_SNAPSHOT_TTL:
+        _metrics_snapshot = performance_monitor._collect_system_metrics()
+        _metrics_snapshot_at = now
+    return _metrics_snapshot
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def system_health(request):
@@ -31,11 +77,13 @@ def system_health(request):
     Get system health status.
     Available to all authenticated users.
     """
+    # Collect once per request and reuse in the error branch
+    metrics = _collect_system_metrics_cached()
     try:
         # Get basic health information
         health_data = {
             'status': 'healthy',
-            'timestamp': performance_monitor._collect_system_metrics().timestamp.isoformat(),
+            'timestamp': metrics.timestamp.isoformat(),
             'cache_health': cache_manager.health_check(),
             'connection_pools': connection_pool_manager.health_check(),
         }
@@ -61,7 +109,7 @@ def system_health(request):
             {
                 'status': 'error',
                 'error': str(e),
-                'timestamp': performance_monitor._collect_system_metrics().timestamp.isoformat()
+                'timestamp': metrics.timestamp.isoformat()
             },
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
@@ -104,15 +152,21 @@ def system_performance_stats(request):
         hours = int(request.GET.get('hours', 1))
         time_window = timedelta(hours=hours)
         
-        stats = performance_monitor.get_stats(time_window)
-        
-        # Add additional admin-specific information
-        stats['slow_queries'] = performance_monitor.get_slow_queries(10)
-        stats['error_summary'] = performance_monitor.get_error_summary(time_window)
-        stats['cache_stats'] = cache_manager.get_cache_stats()
-        stats['connection_pool_stats'] = connection_pool_manager.get_pool_stats()
-        
-        return Response(stats, status=status.HTTP_200_OK)
+        # Each helper hits Redis/DB independently, so fan them out and
+        # overlap the round-trips instead of paying their latency in sum
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            stats_future = executor.submit(performance_monitor.get_stats, time_window)
+            extras = {
+                'slow_queries': executor.submit(performance_monitor.get_slow_queries, 10),
+                'error_summary': executor.submit(performance_monitor.get_error_summary, time_window),
+                'cache_stats': executor.submit(cache_manager.get_cache_stats),
+                'connection_pool_stats': executor.submit(connection_pool_manager.get_pool_stats),
+            }
+            stats = stats_future.result()
+            for key, future in extras.items():
+                stats[key] = future.result()
+
+        return _etag_response(request, stats)
         
     except Exception as e:
         logger.error(f"Failed to get system performance stats: {e}")
@@ -132,11 +186,8 @@ def slow_queries(request):
     try:
         limit = int(request.GET.get('limit', 20))
         slow_queries = performance_monitor.get_slow_queries(limit)
-        
-        return Response(
-            {'slow_queries': slow_queries},
-            status=status.HTTP_200_OK
-        )
+
+        return _etag_response(request, {'slow_queries': slow_queries})
         
     except Exception as e:
         logger.error(f"Failed to get slow queries: {e}")
@@ -158,8 +209,8 @@ def error_summary(request):
         time_window = timedelta(hours=hours)
         
         error_summary = performance_monitor.get_error_summary(time_window)
-        
-        return Response(error_summary, status=status.HTTP_200_OK)
+
+        return _etag_response(request, error_summary)
         
     except Exception as e:
         logger.error(f"Failed to get error summary: {e}")
@@ -243,7 +294,17 @@ def cache_statistics(request):
         # Get Redis-specific information if available
         try:
             if cache_manager.redis_client:
-                redis_info = cache_manager.redis_client.info()
+                # Fetch only the sections we read instead of the full INFO
+                # dump (~150 fields); one pipeline keeps it to a single RTT
+                with cache_manager.redis_client.pipeline(transaction=False) as pipe:
+                    pipe.info('clients')
+                    pipe.info('memory')
+                    pipe.info('stats')
+                    pipe.info('server')
+                    sections = pipe.execute()
+                redis_info = {}
+                for section in sections:
+                    redis_info.update(section)
                 stats['redis_info'] = {
                     'connected_clients': redis_info.get('connected_clients', 0),
                     'used_memory_human': redis_info.get('used_memory_human', 'unknown'),
@@ -255,8 +316,8 @@ def cache_statistics(request):
         except Exception as e:
             logger.warning(f"Failed to get Redis info: {e}")
             stats['redis_info'] = {'error': str(e)}
-        
-        return Response(stats, status=status.HTTP_200_OK)
+
+        return _etag_response(request, stats)
         
     except Exception as e:
         logger.error(f"Failed to get cache statistics: {e}")
@@ -278,8 +339,8 @@ def connection_pool_status(request):
             'health': connection_pool_manager.health_check(),
             'stats': connection_pool_manager.get_pool_stats(),
         }
-        
-        return Response(status_data, status=status.HTTP_200_OK)
+
+        return _etag_response(request, status_data)
         
     except Exception as e:
         logger.error(f"Failed to get connection pool status: {e}")
@@ -312,6 +373,30 @@ def reset_performance_stats(request):
         )
 
 
+def record_recent_query_metric(user_id: str, metric: Dict[str, Any],
+                               max_entries: int = 100, ttl: int = 3600) -> bool:
+    """
+    Append a query metric to the user's capped Redis list.
+
+    Uses LPUSH + LTRIM in one pipeline so memory stays bounded per user
+    and reads only ever transfer the newest entries. Returns False when
+    Redis is unavailable so callers can fall back to the plain cache.
+    """
+    try:
+        if not cache_manager.redis_client:
+            return False
+        cache_key = f"recent_query_metrics_{user_id}"
+        with cache_manager.redis_client.pipeline(transaction=False) as pipe:
+            pipe.lpush(cache_key, json.dumps(metric))
+            pipe.ltrim(cache_key, 0, max_entries - 1)
+            pipe.expire(cache_key, ttl)
+            pipe.execute()
+        return True
+    except Exception as e:
+        logger.warning(f"Failed to record query metric for user {user_id}: {e}")
+        return False
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def query_performance_history(request):
@@ -320,14 +405,27 @@ def query_performance_history(request):
     """
     try:
         user_id = str(request.user.id)
-        
+
         # Get cached recent metrics
         cache_key = f"recent_query_metrics_{user_id}"
-        recent_metrics = cache_manager.get(cache_key, [])
-        
-        # Limit to last 20 queries
-        recent_metrics = recent_metrics[-20:]
-        
+        recent_metrics = None
+
+        # Preferred path: a capped Redis list lets the server ship only
+        # the 20 newest entries instead of the user's whole history
+        try:
+            if cache_manager.redis_client:
+                raw = cache_manager.redis_client.lrange(cache_key, 0, 19)
+                # Newest-first on the wire (LPUSH); restore chronological order
+                recent_metrics = [json.loads(item) for item in reversed(raw)]
+        except Exception as e:
+            logger.warning(f"Redis metrics list unavailable, falling back to cache: {e}")
+            recent_metrics = None
+
+        if recent_metrics is None:
+            recent_metrics = cache_manager.get(cache_key, [])
+            # Limit to last 20 queries
+            recent_metrics = recent_metrics[-20:]
+
         return Response(
             {
                 'user_id': user_id,
@@ -375,6 +473,67 @@ class PerformanceDashboardView(View):
             )
 
 
+class PerformanceDashboardSSEView(View):
+    """
+    Server-Sent Events stream for the performance dashboard.
+    Admin only.
+
+    Polling clients each re-ran the health checks every few seconds; this
+    holds one connection per client and pushes a fresh payload only when
+    a new sample lands on the perf:updates Redis channel, so the checks
+    run once per sample regardless of how many dashboards are open.
+    """
+
+    UPDATES_CHANNEL = 'perf:updates'
+
+    @method_decorator(staff_member_required)
+    def get(self, request):
+        """Stream dashboard payloads as SSE events."""
+        response = StreamingHttpResponse(
+            self._event_stream(),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Disable proxy buffering so events reach the client immediately
+        response['X-Accel-Buffering'] = 'no'
+        return response
+
+    def _dashboard_payload(self) -> Dict[str, Any]:
+        """Same context the polling dashboard view renders."""
+        return {
+            'stats': performance_monitor.get_stats(timedelta(hours=1)),
+            'cache_health': cache_manager.health_check(),
+            'connection_health': connection_pool_manager.health_check(),
+        }
+
+    def _format_event(self) -> str:
+        return f"data: {json.dumps(self._dashboard_payload(), default=str)}\n\n"
+
+    def _event_stream(self):
+        # Initial snapshot so the client renders without waiting for the
+        # first published sample
+        try:
+            yield self._format_event()
+        except Exception as e:
+            logger.error(f"Dashboard SSE snapshot failed: {e}")
+            return
+
+        if not cache_manager.redis_client:
+            return
+
+        pubsub = cache_manager.redis_client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.UPDATES_CHANNEL)
+        try:
+            for message in pubsub.listen():
+                if message.get('type') != 'message':
+                    continue
+                yield self._format_event()
+        except Exception as e:
+            logger.info(f"Dashboard SSE stream closed: {e}")
+        finally:
+            pubsub.close()
+
+
 # Utility view for testing performance monitoring
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
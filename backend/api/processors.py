@@ -1,30 +1,214 @@
 # Consolidated Document Processors - All document processing logic
 
 import os
+import json
 import logging
+import re
 from typing import Dict, Any, List, Optional, Tuple
 import tempfile
 import hashlib
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import asyncio
+import threading
 
 from django.conf import settings
+from django.core.cache import cache
 from django.core.files.storage import default_storage
+from django.db import connections
 from django.utils import timezone
+import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 import PyPDF2
 import docx
 from PIL import Image
 import pytesseract
 import groq
+import httpx
+import magic
+
+try:
+    import fitz  # PyMuPDF: C-backed, several times faster than PyPDF2
+except ImportError:
+    fitz = None
+
+try:
+    import tesserocr  # In-process Tesseract; avoids a fork per image
+except ImportError:
+    tesserocr = None
+
+try:
+    import easyocr  # GPU OCR backend; batches images through one model
+except ImportError:
+    easyocr = None
+
+try:
+    import aiofiles  # Non-blocking file reads for batched TXT loads
+except ImportError:
+    aiofiles = None
+
+try:
+    import orjson  # Rust-backed JSON parsing, tolerant of stray whitespace
+except ImportError:
+    orjson = None
+
+try:
+    import numba  # JIT-compiles the chunk-boundary loop on large corpora
+except ImportError:
+    numba = None
+
+try:
+    import tiktoken  # Token-accurate prompt truncation
+except ImportError:
+    tiktoken = None
+
+_token_encoder = None
+
+
+def _truncate_to_tokens(text: str, token_budget: int, fallback_chars: int,
+                        splice_tail: bool = False) -> str:
+    """Trim text to a token budget, or to a character budget without tiktoken
+
+    Characters are a poor proxy for tokens on dense legal prose, so when
+    tiktoken is installed the budget is enforced on actual token counts.
+    With splice_tail the budget is split between the head and the tail of
+    the document, so conclusions survive truncation.
+    """
+    global _token_encoder
+    if tiktoken is not None:
+        try:
+            if _token_encoder is None:
+                _token_encoder = tiktoken.get_encoding("cl100k_base")
+            ids = _token_encoder.encode(text)
+            if len(ids) <= token_budget:
+                return text
+            if splice_tail:
+                head = _token_encoder.decode(ids[:token_budget // 2])
+                tail = _token_encoder.decode(ids[-(token_budget - token_budget // 2):])
+                return f"{head}\n\n[...]\n\n{tail}"
+            return _token_encoder.decode(ids[:token_budget])
+        except Exception as e:
+            logger.warning(f"Token-aware truncation failed: {str(e)}")
+    if len(text) <= fallback_chars:
+        return text
+    if splice_tail:
+        half = fallback_chars // 2
+        return f"{text[:half]}\n\n[...]\n\n{text[-half:]}"
+    return text[:fallback_chars]
+
+
+def _dumps_json(obj: Dict[str, Any]) -> str:
+    """Serialize to a JSON string with orjson when available, stdlib otherwise"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _loads_json(payload: str) -> Dict[str, Any]:
+    """Parse a JSON object with orjson when available, stdlib otherwise"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
 
 from .models import UserDocument, PublicDocument, ProcessingTask
+from .utils.chunks import chunked
 from .database_consolidated import database_manager
 from .security_consolidated import security_validator, encryption_manager
 
 logger = logging.getLogger(__name__)
 
+# Entity schema returned when extraction is skipped or fails
+_EMPTY_ENTITIES = {
+    "people": [],
+    "organizations": [],
+    "locations": [],
+    "dates": [],
+    "legal_concepts": [],
+    "case_numbers": [],
+    "statutes": []
+}
+
+# Sentence boundaries for chunking: a terminator run followed by
+# whitespace (or end of text)
+_SENTENCE_RE = re.compile(r'[^.!?]*[.!?]+(?:\s+|$)')
+
+
+def _pick_chunk_bounds(ends: np.ndarray, total_length: int,
+                       chunk_size: int, overlap: int) -> np.ndarray:
+    """Select (start, end) offsets for overlapping sentence-aligned chunks
+
+    Written nopython-compatible so numba can compile it; falls back to
+    plain Python when numba is not installed.
+    """
+    capacity = 16
+    bounds = np.empty((capacity, 2), dtype=np.int64)
+    count = 0
+    start = 0
+    while start < total_length:
+        window_end = min(start + chunk_size, total_length)
+        if window_end == total_length:
+            end = total_length
+        else:
+            # Largest sentence end inside the window; hard-cut when a
+            # single sentence overruns chunk_size
+            idx = np.searchsorted(ends, window_end, side='right') - 1
+            end = ends[idx] if idx >= 0 and ends[idx] > start else window_end
+        if count == capacity:
+            capacity *= 2
+            grown = np.empty((capacity, 2), dtype=np.int64)
+            grown[:count] = bounds[:count]
+            bounds = grown
+        bounds[count, 0] = start
+        bounds[count, 1] = end
+        count += 1
+        if end >= total_length:
+            break
+        # Overlap only when it still makes forward progress
+        start = end - overlap if end - start > overlap else end
+    return bounds[:count]
+
+
+if numba is not None:
+    _pick_chunk_bounds = numba.njit(cache=True)(_pick_chunk_bounds)
+
+# One connection pool shared by every processor instance, so Groq calls
+# reuse keep-alive connections instead of re-handshaking TLS per client
+_GROQ_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_GROQ_TIMEOUT = 30
+
+_shared_groq_client = None
+
+
+def get_shared_groq_client():
+    """Process-wide Groq client backed by a pooled httpx.Client"""
+    global _shared_groq_client
+    if _shared_groq_client is None:
+        _shared_groq_client = groq.Groq(
+            api_key=settings.GROQ_API_KEY,
+            http_client=httpx.Client(limits=_GROQ_HTTP_LIMITS, timeout=_GROQ_TIMEOUT),
+        )
+    return _shared_groq_client
+
+
+def hash_file_contents(file_path: str) -> str:
+    """
+    Content-hash a file with SHA-256 for deduplication/fingerprinting.
+
+    Uses hashlib.file_digest (Python 3.11+), which streams through
+    OpenSSL's hardware-accelerated (SHA-NI/AVX) implementation without
+    round-tripping chunks through Python. Falls back to 1 MiB streamed
+    updates on older interpreters; neither path loads the file into RAM.
+    """
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+        return digest.hexdigest()
+
+
 # ============================================================================
 # BASE DOCUMENT PROCESSOR
 # ============================================================================
@@ -35,37 +219,91 @@ class BaseDocumentProcessor:
     def __init__(self):
         self.embedding_model = None
         self.llm_client = None
+        self.ocr_reader = None
         self.chunk_size = 1000
         self.chunk_overlap = 200
     
     def get_embedding_model(self):
         """Lazy load embedding model"""
         if self.embedding_model is None:
-            self.embedding_model = SentenceTransformer('all-mpnet-base-v2')
+            model = SentenceTransformer('all-mpnet-base-v2')
+            # fp16 halves memory bandwidth and roughly doubles encoder
+            # throughput on tensor cores; CPU inference stays fp32
+            if torch.cuda.is_available():
+                model = model.half().to('cuda')
+            self.embedding_model = model
         return self.embedding_model
     
     def get_llm_client(self):
-        """Lazy load LLM client"""
+        """Lazy load LLM client (shared connection pool across processors)"""
         if self.llm_client is None:
-            self.llm_client = groq.Groq(api_key=settings.GROQ_API_KEY)
+            self.llm_client = get_shared_groq_client()
         return self.llm_client
     
+    # Extracted text survives retries/reprocessing of identical files;
+    # OCR in particular costs seconds per page
+    TEXT_CACHE_TTL = 30 * 24 * 3600
+
+    # Extension → extractor; sniffed MIME types take precedence so a
+    # misnamed upload (a JPEG scan saved as .pdf) routes correctly
+    _EXTENSION_HANDLERS = {
+        '.txt': '_extract_from_txt',
+        '.pdf': '_extract_from_pdf',
+        '.docx': '_extract_from_docx',
+        '.doc': '_extract_from_docx',
+        '.jpg': '_extract_from_image',
+        '.jpeg': '_extract_from_image',
+        '.png': '_extract_from_image',
+        '.tiff': '_extract_from_image',
+    }
+    _MIME_HANDLERS = {
+        'text/plain': '_extract_from_txt',
+        'application/pdf': '_extract_from_pdf',
+        'application/vnd.openxmlformats-officedocument.wordprocessingml.document': '_extract_from_docx',
+        'application/msword': '_extract_from_docx',
+        'image/jpeg': '_extract_from_image',
+        'image/png': '_extract_from_image',
+        'image/tiff': '_extract_from_image',
+    }
+
     def extract_text_from_file(self, file_path: str) -> Tuple[str, Optional[str]]:
-        """Extract text from various file formats"""
+        """Extract text from various file formats, cached by content hash"""
         try:
             file_ext = os.path.splitext(file_path)[1].lower()
-            
-            if file_ext == '.txt':
-                return self._extract_from_txt(file_path)
-            elif file_ext == '.pdf':
-                return self._extract_from_pdf(file_path)
-            elif file_ext in ['.docx', '.doc']:
-                return self._extract_from_docx(file_path)
-            elif file_ext in ['.jpg', '.jpeg', '.png', '.tiff']:
-                return self._extract_from_image(file_path)
-            else:
+
+            # Reprocessing an identical file (task retries, re-uploads) can
+            # skip the PyPDF2/docx/tesseract pass entirely
+            cache_key = None
+            try:
+                content_hash = hash_file_contents(file_path)
+                cache_key = f"doc_text:{content_hash}"
+                cached_text = cache.get(cache_key)
+                if cached_text is not None:
+                    return cached_text, None
+            except Exception as e:
+                logger.warning(f"Extraction cache lookup failed for {file_path}: {str(e)}")
+
+            handler_name = self._EXTENSION_HANDLERS.get(file_ext)
+            try:
+                mime_handler = self._MIME_HANDLERS.get(
+                    magic.from_file(file_path, mime=True)
+                )
+                if mime_handler is not None:
+                    handler_name = mime_handler
+            except Exception as e:
+                # Sniffing is best-effort; the extension route still works
+                logger.warning(f"MIME detection failed for {file_path}: {str(e)}")
+
+            if handler_name is None:
                 return "", f"Unsupported file type: {file_ext}"
-                
+
+            text, error = getattr(self, handler_name)(file_path)
+
+            if not error and cache_key:
+                cache.set(cache_key, text, self.TEXT_CACHE_TTL)
+
+            return text, error
+
         except Exception as e:
             logger.error(f"Text extraction failed for {file_path}: {str(e)}")
             return "", f"Text extraction failed: {str(e)}"
@@ -86,28 +324,89 @@ class BaseDocumentProcessor:
                 except UnicodeDecodeError:
                     continue
             return "", "Unable to decode text file"
-    
+
+    def _extract_from_txts_batch(self, file_paths: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        Read a set of TXT files with overlapped disk I/O.
+
+        Each synchronous read blocks for its full disk latency; gathering
+        aiofiles coroutines lets the reads overlap, so a batch costs
+        roughly one latency instead of the sum. Decoding follows the same
+        encoding fallbacks as the single-file path.
+        """
+        if not file_paths:
+            return []
+        if aiofiles is None:
+            return [self._extract_from_txt(path) for path in file_paths]
+
+        async def read_one(path: str) -> Tuple[str, Optional[str]]:
+            try:
+                async with aiofiles.open(path, 'rb') as f:
+                    raw = await f.read()
+            except Exception as e:
+                return "", f"Text extraction failed: {str(e)}"
+
+            for encoding in ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']:
+                try:
+                    return raw.decode(encoding), None
+                except UnicodeDecodeError:
+                    continue
+            return "", "Unable to decode text file"
+
+        async def read_all() -> List[Tuple[str, Optional[str]]]:
+            return await asyncio.gather(*(read_one(path) for path in file_paths))
+
+        return asyncio.run(read_all())
+
     def _extract_from_pdf(self, file_path: str) -> Tuple[str, Optional[str]]:
-        """Extract text from PDF file"""
+        """Extract text from PDF file (PyMuPDF, falling back to PyPDF2)"""
+        if fitz is not None:
+            try:
+                parts = []
+                with fitz.open(file_path) as doc:
+                    for page_num, page in enumerate(doc):
+                        page_text = page.get_text('text')
+                        if page_text:
+                            parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}\n")
+
+                text = "".join(parts)
+                if not text.strip():
+                    return "", "No text found in PDF"
+
+                return text, None
+
+            except Exception as e:
+                # Malformed files PyMuPDF refuses sometimes still parse
+                # with PyPDF2, so fall through rather than fail
+                logger.warning(f"PyMuPDF extraction failed for {file_path}, "
+                               f"falling back to PyPDF2: {str(e)}")
+
+        return self._extract_from_pdf_pypdf2(file_path)
+
+    def _extract_from_pdf_pypdf2(self, file_path: str) -> Tuple[str, Optional[str]]:
+        """Extract text from PDF file with PyPDF2"""
         try:
-            text = ""
+            # Appending page strings and joining once keeps assembly
+            # linear; += re-copies the accumulated text every page
+            parts = []
             with open(file_path, 'rb') as f:
                 pdf_reader = PyPDF2.PdfReader(f)
-                
+
                 for page_num, page in enumerate(pdf_reader.pages):
                     try:
                         page_text = page.extract_text()
                         if page_text:
-                            text += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
+                            parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}\n")
                     except Exception as e:
                         logger.warning(f"Failed to extract text from page {page_num + 1}: {str(e)}")
                         continue
-            
+
+            text = "".join(parts)
             if not text.strip():
                 return "", "No text found in PDF"
-            
+
             return text, None
-            
+
         except Exception as e:
             return "", f"PDF extraction failed: {str(e)}"
     
@@ -163,56 +462,246 @@ class BaseDocumentProcessor:
             
         except Exception as e:
             return "", f"OCR extraction failed: {str(e)}"
-    
+
+    def _extract_from_images_batch(self, file_paths: List[str]) -> List[Tuple[str, Optional[str]]]:
+        """
+        OCR a set of images with one resident Tesseract instance.
+
+        pytesseract forks a fresh tesseract process per image and pays
+        model load each time; tesserocr keeps the engine in-process, so
+        init cost is paid once per batch. Falls back to the per-image
+        path when tesserocr is not installed.
+        """
+        if not file_paths:
+            return []
+        if tesserocr is None:
+            return [self._extract_from_image(path) for path in file_paths]
+
+        try:
+            results = []
+            with tesserocr.PyTessBaseAPI(lang='eng') as api:
+                for path in file_paths:
+                    try:
+                        image = Image.open(path)
+                        if image.mode != 'RGB':
+                            image = image.convert('RGB')
+                        api.SetImage(image)
+                        extracted_text = api.GetUTF8Text()
+
+                        if extracted_text.strip():
+                            results.append((extracted_text, None))
+                        else:
+                            results.append(("", "No text found in image"))
+                    except Exception as e:
+                        results.append(("", f"OCR extraction failed: {str(e)}"))
+            return results
+
+        except Exception as e:
+            logger.warning(f"Batched OCR unavailable, falling back to per-image: {str(e)}")
+            return [self._extract_from_image(path) for path in file_paths]
+
+    def get_ocr_reader(self):
+        """Lazy load the EasyOCR reader (GPU when available)"""
+        if self.ocr_reader is None and easyocr is not None:
+            reader = easyocr.Reader(['en'], gpu=torch.cuda.is_available())
+            if torch.cuda.is_available():
+                # Prime cuDNN autotune with a dummy batch so the first
+                # real document doesn't pay the benchmark pass
+                try:
+                    reader.readtext_batched(
+                        np.zeros([1920, 1280, 3], dtype=np.uint8), detail=0
+                    )
+                except Exception as e:
+                    logger.warning(f"OCR warmup failed: {str(e)}")
+            self.ocr_reader = reader
+        return self.ocr_reader
+
+    def _extract_from_images_gpu(self, file_paths: List[str],
+                                 n_width: int = 1280,
+                                 n_height: int = 1920) -> List[Tuple[str, Optional[str]]]:
+        """
+        OCR a set of images as one GPU tensor batch via EasyOCR.
+
+        Images are resized to a common shape and run through the
+        detection/recognition models in batched kernel dispatches rather
+        than one Tesseract pass per file. Falls back to the in-process
+        Tesseract batch when EasyOCR or a GPU is unavailable.
+        """
+        if not file_paths:
+            return []
+
+        reader = self.get_ocr_reader()
+        if reader is None or not torch.cuda.is_available():
+            return self._extract_from_images_batch(file_paths)
+
+        try:
+            batched = reader.readtext_batched(
+                file_paths,
+                n_width=n_width,
+                n_height=n_height,
+                detail=0,
+                paragraph=True
+            )
+            results = []
+            for lines in batched:
+                extracted_text = "\n".join(lines)
+                if extracted_text.strip():
+                    results.append((extracted_text, None))
+                else:
+                    results.append(("", "No text found in image"))
+            return results
+
+        except Exception as e:
+            logger.warning(f"GPU OCR failed, falling back to Tesseract: {str(e)}")
+            return self._extract_from_images_batch(file_paths)
+
     def chunk_text(self, text: str) -> List[str]:
-        """Split text into chunks for processing"""
+        """Split text into overlapping chunks along sentence boundaries"""
         if not text:
             return []
-        
-        # Simple sentence-based chunking
-        sentences = text.split('. ')
+
+        # One compiled-regex pass collects every sentence end offset;
+        # chunks are then cut as slices of the original text, so nothing
+        # is re-accumulated character by character
+        ends = np.fromiter(
+            (match.end() for match in _SENTENCE_RE.finditer(text)),
+            dtype=np.int64
+        )
+        total_length = len(text)
+        if ends.size == 0 or ends[-1] < total_length:
+            ends = np.append(ends, total_length)
+
+        bounds = _pick_chunk_bounds(
+            ends, total_length, self.chunk_size, self.chunk_overlap
+        )
+
         chunks = []
-        current_chunk = ""
-        
-        for sentence in sentences:
-            # Add sentence to current chunk
-            test_chunk = current_chunk + sentence + ". "
-            
-            if len(test_chunk) <= self.chunk_size:
-                current_chunk = test_chunk
-            else:
-                # Save current chunk and start new one
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                
-                # Handle overlap
-                if len(chunks) > 0 and self.chunk_overlap > 0:
-                    overlap_text = chunks[-1][-self.chunk_overlap:]
-                    current_chunk = overlap_text + sentence + ". "
-                else:
-                    current_chunk = sentence + ". "
-        
-        # Add final chunk
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-        
+        for start, end in bounds:
+            chunk = text[start:end].strip()
+            if chunk:
+                chunks.append(chunk)
         return chunks
     
-    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for text chunks"""
+    # all-mpnet-base-v2 output width
+    EMBEDDING_DIM = 768
+    # Duplicate chunks recur across amended filings and re-uploads;
+    # cached vectors are stored as fp16 bytes (half the wire size,
+    # negligible retrieval-quality loss)
+    EMBEDDING_CACHE_TTL = 30 * 24 * 3600
+
+    def generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for text chunks, cached by chunk hash"""
         try:
-            model = self.get_embedding_model()
-            embeddings = model.encode(texts)
-            return embeddings.tolist()
+            keys = [
+                f"emb:{hashlib.blake2b(text.encode()).hexdigest()}"
+                for text in texts
+            ]
+            try:
+                hits = cache.get_many(keys)
+            except Exception as e:
+                logger.warning(f"Embedding cache lookup failed: {str(e)}")
+                hits = {}
+
+            out = np.empty((len(texts), self.EMBEDDING_DIM), dtype=np.float32)
+            miss_indices = []
+            for i, key in enumerate(keys):
+                raw = hits.get(key)
+                if raw is not None:
+                    out[i] = np.frombuffer(raw, dtype=np.float16).astype(np.float32)
+                else:
+                    miss_indices.append(i)
+
+            if miss_indices:
+                model = self.get_embedding_model()
+                # One batched call amortizes tokenizer and dispatch
+                # overhead across all uncached chunks; normalized output
+                # matches the IP metric used by the Milvus collections
+                encoded = np.asarray(model.encode(
+                    [texts[i] for i in miss_indices],
+                    batch_size=64,
+                    convert_to_numpy=True,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                ), dtype=np.float32)
+                for j, i in enumerate(miss_indices):
+                    out[i] = encoded[j]
+                try:
+                    cache.set_many(
+                        {
+                            keys[i]: encoded[j].astype(np.float16).tobytes()
+                            for j, i in enumerate(miss_indices)
+                        },
+                        self.EMBEDDING_CACHE_TTL
+                    )
+                except Exception as e:
+                    logger.warning(f"Embedding cache store failed: {str(e)}")
+
+            # Keep the ndarray: Milvus accepts float32 rows directly, so
+            # there is no need to round-trip through Python float lists
+            return out
         except Exception as e:
             logger.error(f"Embedding generation failed: {str(e)}")
-            return []
+            return np.empty((0, self.EMBEDDING_DIM), dtype=np.float32)
     
+    # Upper bound on rows per Milvus insert call so a huge document
+    # doesn't become one oversized gRPC message that risks timeouts
+    MILVUS_INSERT_MAX_ROWS = 1024
+
+    def _insert_vectors_batched(self, vector_data: Dict[str, Any],
+                                collection_name: str,
+                                is_personal: bool) -> bool:
+        """Insert columnar vector data, sliced into bounded batches"""
+        num_rows = len(vector_data['chunk_id'])
+        if num_rows <= self.MILVUS_INSERT_MAX_ROWS:
+            return database_manager.milvus.insert_vectors(
+                vector_data, collection_name, is_personal=is_personal
+            )
+        for start in range(0, num_rows, self.MILVUS_INSERT_MAX_ROWS):
+            end = start + self.MILVUS_INSERT_MAX_ROWS
+            batch = {
+                field: column[start:end]
+                for field, column in vector_data.items()
+            }
+            if not database_manager.milvus.insert_vectors(
+                batch, collection_name, is_personal=is_personal
+            ):
+                return False
+        return True
+
+    # LLM outputs are deterministic enough at low temperature to reuse;
+    # legal filings repeat boilerplate, so identical prefixes recur often
+    LLM_CACHE_TTL = 7 * 24 * 3600
+
+    # Below this there is too little context for the LLM to find
+    # meaningful entities — not worth a 70B-model round-trip
+    MIN_ENTITY_TEXT_LENGTH = 500
+
+    # Prompt-input budgets. Prefill cost is linear in tokens, so these
+    # cap it directly; the char values only apply without tiktoken
+    ENTITY_TOKEN_BUDGET = 3500
+    ENTITY_FALLBACK_CHARS = 2000
+    SUMMARY_TOKEN_BUDGET = 12000
+    SUMMARY_FALLBACK_CHARS = 15000
+
     def extract_entities(self, text: str) -> Dict[str, Any]:
-        """Extract entities from text using LLM"""
+        """Extract entities from text using LLM, cached by text prefix"""
         try:
+            if len(text.strip()) < self.MIN_ENTITY_TEXT_LENGTH:
+                return {key: [] for key in _EMPTY_ENTITIES}
+
+            prompt_text = _truncate_to_tokens(
+                text, self.ENTITY_TOKEN_BUDGET, self.ENTITY_FALLBACK_CHARS
+            )
+
+            # Only the truncated text reaches the prompt, so its hash fully
+            # determines the request — a hit skips the Groq call outright
+            cache_key = f"entities:{hashlib.blake2b(prompt_text.encode()).hexdigest()}"
+            cached_entities = cache.get(cache_key)
+            if cached_entities is not None:
+                return cached_entities
+
             client = self.get_llm_client()
-            
+
             prompt = f"""Extract key entities from this legal document text. Return a JSON object with the following structure:
 {{
     "people": ["list of person names"],
@@ -224,7 +713,7 @@ class BaseDocumentProcessor:
     "statutes": ["list of statutes or laws mentioned"]
 }}
 
-Text: {text[:2000]}...
+Text: {prompt_text}...
 
 JSON:"""
 
@@ -232,25 +721,20 @@ JSON:"""
                 model="llama-3.3-70b-versatile",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
-                max_tokens=1000
+                max_tokens=1000,
+                # JSON mode constrains the reply to a parseable object,
+                # avoiding retry-worthy prose around the payload
+                response_format={"type": "json_object"}
             )
-            
+
             # Parse JSON response
-            import json
-            entities = json.loads(response.choices[0].message.content)
+            entities = _loads_json(response.choices[0].message.content)
+            cache.set(cache_key, entities, self.LLM_CACHE_TTL)
             return entities
             
         except Exception as e:
             logger.error(f"Entity extraction failed: {str(e)}")
-            return {
-                "people": [],
-                "organizations": [],
-                "locations": [],
-                "dates": [],
-                "legal_concepts": [],
-                "case_numbers": [],
-                "statutes": []
-            }
+            return {key: [] for key in _EMPTY_ENTITIES}
 
 
 # ============================================================================
@@ -260,12 +744,15 @@ JSON:"""
 class PublicDocumentProcessor(BaseDocumentProcessor):
     """Process public legal documents for the knowledge base"""
     
-    def process_document(self, document: PublicDocument) -> Dict[str, Any]:
+    def process_document(self, document: PublicDocument,
+                         mark_processing: bool = True) -> Dict[str, Any]:
         """Process public document completely"""
         try:
-            # Update status
+            # Update status (batch callers pre-mark the whole set with a
+            # single UPDATE and pass mark_processing=False)
             document.processing_status = 'processing'
-            document.save()
+            if mark_processing:
+                document.save()
             
             # Extract text
             text, error = self.extract_text_from_file(document.file_path.path)
@@ -281,37 +768,45 @@ class PublicDocumentProcessor(BaseDocumentProcessor):
                 document.save()
                 return {'success': False, 'error': 'No text chunks generated'}
             
-            # Generate embeddings
-            embeddings = self.generate_embeddings(chunks)
-            if not embeddings:
+            # Entity extraction is a network round-trip and embedding is
+            # local compute, so overlap them instead of paying their
+            # latency in sequence
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                entities_future = executor.submit(self.extract_entities, text)
+                embeddings = self.generate_embeddings(chunks)
+                entities = entities_future.result()
+
+            if len(embeddings) == 0:
                 document.processing_status = 'failed'
                 document.save()
                 return {'success': False, 'error': 'Failed to generate embeddings'}
-            
-            # Extract entities
-            entities = self.extract_entities(text)
-            
-            # Store in vector database
-            vector_data = []
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                vector_data.append({
-                    'document_id': str(document.id),
-                    'chunk_id': f"{document.id}_{i}",
-                    'content': chunk,
-                    'embedding': embedding,
-                    'metadata': {
-                        'document_type': document.document_type,
-                        'legal_domain': document.legal_domain,
-                        'title': document.title,
-                        'chunk_index': i,
-                        'total_chunks': len(chunks)
-                    }
-                })
-            
+
+            # Store in vector database. Column-oriented buffers: the
+            # embedding matrix stays one (N, dim) float32 array and each
+            # scalar field is a flat list, so the client serializes
+            # columns instead of walking N row dicts
+            num_chunks = len(chunks)
+            # Metadata only differs per chunk in its index, so serialize
+            # the shared fields once and splice the index in instead of
+            # encoding N near-identical dicts
+            meta_prefix = _dumps_json({
+                'document_type': document.document_type,
+                'legal_domain': document.legal_domain,
+                'title': document.title,
+                'total_chunks': num_chunks
+            })[:-1] + ',"chunk_index":'
+            vector_data = {
+                'document_id': [str(document.id)] * num_chunks,
+                'chunk_id': [f"{document.id}_{i}" for i in range(num_chunks)],
+                'content': chunks,
+                'embedding': embeddings,
+                'metadata': [f"{meta_prefix}{i}}}" for i in range(num_chunks)],
+            }
+
             # Insert into Milvus
-            success = database_manager.milvus.insert_vectors(
-                vector_data, 
-                "public_documents", 
+            success = self._insert_vectors_batched(
+                vector_data,
+                "public_documents",
                 is_personal=False
             )
             
@@ -365,13 +860,35 @@ class PublicDocumentProcessor(BaseDocumentProcessor):
 
 class PersonalDocumentProcessor(BaseDocumentProcessor):
     """Process personal user documents with data segregation"""
-    
-    def process_document(self, document: UserDocument) -> Dict[str, Any]:
+
+    # Slice size for the encrypted side copy: encrypting and writing
+    # 64K segments keeps peak memory at plaintext + one segment of
+    # ciphertext instead of plaintext + full ciphertext
+    ENCRYPT_SEGMENT_CHARS = 64 * 1024
+
+    @classmethod
+    def _write_encrypted_copy(cls, text: str, encrypted_path: str):
+        """Encrypt and persist the side copy in segments; failures are logged only"""
+        try:
+            with open(encrypted_path, 'w') as f:
+                # Newline-delimited ciphertext segments; nothing downstream
+                # reads this file back, it exists for at-rest coverage
+                for start in range(0, len(text), cls.ENCRYPT_SEGMENT_CHARS):
+                    segment = text[start:start + cls.ENCRYPT_SEGMENT_CHARS]
+                    f.write(encryption_manager.encrypt_data(segment))
+                    f.write('\n')
+        except Exception as e:
+            logger.warning(f"Document encryption failed: {str(e)}")
+
+    def process_document(self, document: UserDocument,
+                         mark_processing: bool = True) -> Dict[str, Any]:
         """Process personal document with user isolation"""
         try:
-            # Update status
+            # Update status (batch callers pre-mark the whole set with a
+            # single UPDATE and pass mark_processing=False)
             document.status = 'processing'
-            document.save()
+            if mark_processing:
+                document.save()
             
             # Extract text
             text, error = self.extract_text_from_file(document.file_path.path)
@@ -380,16 +897,15 @@ class PersonalDocumentProcessor(BaseDocumentProcessor):
                 document.save()
                 return {'success': False, 'error': error}
             
-            # Encrypt sensitive content if required
+            # Encrypt sensitive content if required. The encrypted copy
+            # is a side artifact nothing downstream reads, so the write
+            # happens off-thread instead of stalling the pipeline on disk
             if getattr(settings, 'ENCRYPT_USER_DOCUMENTS', False):
-                try:
-                    encrypted_text = encryption_manager.encrypt_data(text)
-                    # Store encrypted version separately
-                    encrypted_path = document.file_path.path + '.encrypted'
-                    with open(encrypted_path, 'w') as f:
-                        f.write(encrypted_text)
-                except Exception as e:
-                    logger.warning(f"Document encryption failed: {str(e)}")
+                threading.Thread(
+                    target=self._write_encrypted_copy,
+                    args=(text, document.file_path.path + '.encrypted'),
+                    daemon=True
+                ).start()
             
             # Chunk text
             chunks = self.chunk_text(text)
@@ -398,40 +914,56 @@ class PersonalDocumentProcessor(BaseDocumentProcessor):
                 document.save()
                 return {'success': False, 'error': 'No text chunks generated'}
             
-            # Generate embeddings
-            embeddings = self.generate_embeddings(chunks)
-            if not embeddings:
+            # Same overlap as the public pipeline: the LLM call rides the
+            # network while embeddings use local compute. When a summary
+            # is requested, one fused request returns both it and the
+            # entities, halving Groq round-trips and prefill tokens
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                if document.summary_type:
+                    analysis_future = executor.submit(
+                        self.analyze_document, text, document.summary_type
+                    )
+                else:
+                    analysis_future = executor.submit(self.extract_entities, text)
+                embeddings = self.generate_embeddings(chunks)
+                analysis = analysis_future.result()
+
+            if document.summary_type:
+                entities = analysis['entities']
+                summary = analysis['summary']
+            else:
+                entities = analysis
+                summary = ""
+
+            if len(embeddings) == 0:
                 document.status = 'failed'
                 document.save()
                 return {'success': False, 'error': 'Failed to generate embeddings'}
-            
-            # Extract entities
-            entities = self.extract_entities(text)
-            
-            # Store in user-specific vector collection
+
+            # Store in user-specific vector collection, columnar like the
+            # public path
             user_collection_name = f"user_{document.user.id.hex}"
-            vector_data = []
-            
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                vector_data.append({
-                    'user_id': document.user.id.hex,
-                    'document_id': str(document.id),
-                    'chunk_id': f"{document.id}_{i}",
-                    'content': chunk,
-                    'embedding': embedding,
-                    'metadata': {
-                        'file_name': document.file_name,
-                        'file_type': document.file_type,
-                        'chunk_index': i,
-                        'total_chunks': len(chunks),
-                        'upload_date': document.created_at.isoformat()
-                    }
-                })
+            num_chunks = len(chunks)
+            # Shared-template metadata encoding, same as the public path
+            meta_prefix = _dumps_json({
+                'file_name': document.file_name,
+                'file_type': document.file_type,
+                'total_chunks': num_chunks,
+                'upload_date': document.created_at.isoformat()
+            })[:-1] + ',"chunk_index":'
+            vector_data = {
+                'user_id': [document.user.id.hex] * num_chunks,
+                'document_id': [str(document.id)] * num_chunks,
+                'chunk_id': [f"{document.id}_{i}" for i in range(num_chunks)],
+                'content': chunks,
+                'embedding': embeddings,
+                'metadata': [f"{meta_prefix}{i}}}" for i in range(num_chunks)],
+            }
             
             # Insert into user's Milvus collection
-            success = database_manager.milvus.insert_vectors(
-                vector_data, 
-                user_collection_name, 
+            success = self._insert_vectors_batched(
+                vector_data,
+                user_collection_name,
                 is_personal=True
             )
             
@@ -453,17 +985,10 @@ class PersonalDocumentProcessor(BaseDocumentProcessor):
             }
             
             graph_success = database_manager.neo4j.insert_document_graph(
-                graph_data, 
+                graph_data,
                 user_id=document.user.id.hex
             )
             
-            # Generate summary if requested
-            summary = ""
-            if document.summary_type:
-                summary_result = self.generate_summary(text, document.summary_type)
-                if summary_result['success']:
-                    summary = summary_result['summary']
-            
             # Update document status
             document.status = 'completed'
             document.summary = summary
@@ -485,141 +1010,313 @@ class PersonalDocumentProcessor(BaseDocumentProcessor):
             document.save()
             return {'success': False, 'error': str(e)}
     
-    def generate_summary(self, text: str, summary_type: str) -> Dict[str, Any]:
-        """Generate document summary"""
+    # Concurrent in-flight Groq requests during batch summarization
+    MAX_CONCURRENT_LLM_CALLS = 8
+
+    def _build_summary_prompt(self, text: str, summary_type: str) -> str:
+        """Build the summary prompt for a document"""
+        # Head+tail splice so holdings and conclusions at the end of a
+        # long filing survive truncation
+        text = _truncate_to_tokens(
+            text, self.SUMMARY_TOKEN_BUDGET, self.SUMMARY_FALLBACK_CHARS,
+            splice_tail=True
+        )
+
+        # Summary prompts
+        prompts = {
+            'brief': f"Provide a brief 2-3 paragraph summary of this document:\n\n{text}",
+            'comprehensive': f"Provide a comprehensive analysis including overview, key points, and implications:\n\n{text}",
+            'legal_issues': f"Identify and analyze all legal issues in this document:\n\n{text}",
+            'clause_by_clause': f"Provide a clause-by-clause analysis of this document:\n\n{text}"
+        }
+
+        return prompts.get(summary_type, prompts['comprehensive'])
+
+    def analyze_document(self, text: str, summary_type: str) -> Dict[str, Any]:
+        """
+        Extract entities and generate the summary in one Groq request.
+
+        The document text dominates both prompts, so fusing the calls
+        sends it (and pays the network round-trip) once instead of
+        twice. Returns {'entities': {...}, 'summary': str}; on a
+        malformed reply it falls back to the separate calls so neither
+        result is lost.
+        """
+        summary_instruction = {
+            'brief': "a brief 2-3 paragraph summary of the document",
+            'comprehensive': "a comprehensive analysis including overview, key points, and implications",
+            'legal_issues': "an identification and analysis of all legal issues in the document",
+            'clause_by_clause': "a clause-by-clause analysis of the document"
+        }.get(summary_type, "a comprehensive analysis including overview, key points, and implications")
+
+        # Same head+tail splice as the summary prompt
+        text_for_prompt = _truncate_to_tokens(
+            text, self.SUMMARY_TOKEN_BUDGET, self.SUMMARY_FALLBACK_CHARS,
+            splice_tail=True
+        )
+
+        prompt = f"""Analyze this legal document. Return a JSON object with exactly two keys:
+{{
+    "entities": {{
+        "people": ["list of person names"],
+        "organizations": ["list of organization names"],
+        "locations": ["list of locations"],
+        "dates": ["list of dates"],
+        "legal_concepts": ["list of legal concepts"],
+        "case_numbers": ["list of case numbers"],
+        "statutes": ["list of statutes or laws mentioned"]
+    }},
+    "summary": "{summary_instruction}"
+}}
+
+Document: {text_for_prompt}
+
+JSON:"""
+
         try:
+            cache_key = f"analysis:{hashlib.blake2b(prompt.encode()).hexdigest()}"
+            cached_analysis = cache.get(cache_key)
+            if cached_analysis is not None:
+                return cached_analysis
+
             client = self.get_llm_client()
-            
-            # Truncate text if too long
-            max_chars = 15000
-            if len(text) > max_chars:
-                text = text[:max_chars] + "\n\n[Document truncated due to length...]"
-            
-            # Summary prompts
-            prompts = {
-                'brief': f"Provide a brief 2-3 paragraph summary of this document:\n\n{text}",
-                'comprehensive': f"Provide a comprehensive analysis including overview, key points, and implications:\n\n{text}",
-                'legal_issues': f"Identify and analyze all legal issues in this document:\n\n{text}",
-                'clause_by_clause': f"Provide a clause-by-clause analysis of this document:\n\n{text}"
+            response = client.chat.completions.create(
+                model="llama-3.3-70b-versatile",
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=3000,
+                response_format={"type": "json_object"}
+            )
+
+            result = _loads_json(response.choices[0].message.content)
+            analysis = {
+                'entities': result.get('entities') or {key: [] for key in _EMPTY_ENTITIES},
+                'summary': result.get('summary') or ''
             }
-            
-            prompt = prompts.get(summary_type, prompts['comprehensive'])
-            
+            cache.set(cache_key, analysis, self.LLM_CACHE_TTL)
+            return analysis
+
+        except Exception as e:
+            logger.error(f"Fused document analysis failed, retrying separately: {str(e)}")
+            summary_result = self.generate_summary(text, summary_type)
+            return {
+                'entities': self.extract_entities(text),
+                'summary': summary_result['summary'] if summary_result['success'] else ''
+            }
+
+    def generate_summary(self, text: str, summary_type: str) -> Dict[str, Any]:
+        """Generate document summary, cached by prompt hash"""
+        try:
+            prompt = self._build_summary_prompt(text, summary_type)
+
+            # Same reuse pattern as extract_entities: the prompt hash
+            # fully determines the request
+            cache_key = f"summary:{hashlib.blake2b(prompt.encode()).hexdigest()}"
+            cached_summary = cache.get(cache_key)
+            if cached_summary is not None:
+                return {'success': True, 'summary': cached_summary}
+
+            client = self.get_llm_client()
+
             response = client.chat.completions.create(
                 model="llama-3.3-70b-versatile",
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
                 max_tokens=2000
             )
-            
+
             summary = response.choices[0].message.content
-            
+            cache.set(cache_key, summary, self.LLM_CACHE_TTL)
+
             return {'success': True, 'summary': summary}
-            
+
         except Exception as e:
             logger.error(f"Summary generation failed: {str(e)}")
             return {'success': False, 'error': str(e)}
 
+    def generate_summaries(self, texts: List[str], summary_type: str) -> List[Dict[str, Any]]:
+        """
+        Generate summaries for multiple documents concurrently.
+
+        Summarization wall-clock is dominated by Groq round-trip latency,
+        not local CPU, so overlapping requests cuts total time roughly by
+        the concurrency width. Results are returned in input order; a
+        failed request yields its error dict without aborting the batch.
+        """
+        if not texts:
+            return []
+        return asyncio.run(self._generate_summaries_async(texts, summary_type))
+
+    async def _generate_summaries_async(self, texts: List[str], summary_type: str) -> List[Dict[str, Any]]:
+        client = groq.AsyncGroq(
+            api_key=settings.GROQ_API_KEY,
+            http_client=httpx.AsyncClient(limits=_GROQ_HTTP_LIMITS, timeout=_GROQ_TIMEOUT),
+        )
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_LLM_CALLS)
+
+        async def summarize(text: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    response = await client.chat.completions.create(
+                        model="llama-3.3-70b-versatile",
+                        messages=[{"role": "user", "content": self._build_summary_prompt(text, summary_type)}],
+                        temperature=0.3,
+                        max_tokens=2000
+                    )
+                    return {'success': True, 'summary': response.choices[0].message.content}
+                except Exception as e:
+                    logger.error(f"Summary generation failed: {str(e)}")
+                    return {'success': False, 'error': str(e)}
+
+        try:
+            return await asyncio.gather(*(summarize(text) for text in texts))
+        finally:
+            await client.close()
+
 
 # ============================================================================
 # BATCH PROCESSOR
 # ============================================================================
 
+def _process_public_document_worker(document_id: str) -> Dict[str, Any]:
+    """Child-process entry point: only the id crosses the pickle boundary"""
+    document = PublicDocument.objects.get(id=document_id)
+    return PublicDocumentProcessor().process_document(document, mark_processing=False)
+
+
+def _process_user_document_worker(document_id: str, user_id: str) -> Dict[str, Any]:
+    """Child-process entry point for personal documents"""
+    document = UserDocument.objects.get(id=document_id, user_id=user_id)
+    return PersonalDocumentProcessor().process_document(document, mark_processing=False)
+
+
 class BatchDocumentProcessor:
-    """Process multiple documents in parallel"""
-    
+    """
+    Process multiple documents in parallel.
+
+    Uses a process pool: PDF parsing, OCR and local embedding inference
+    are CPU-bound and would serialize behind the GIL in a thread pool.
+    Workers receive document ids and refetch the row themselves, so no
+    ORM instance is pickled across the process boundary.
+    """
+
     def __init__(self, max_workers: int = 3):
         self.max_workers = max_workers
         self.public_processor = PublicDocumentProcessor()
         self.personal_processor = PersonalDocumentProcessor()
-    
+
     def process_public_documents(self, document_ids: List[str]) -> Dict[str, Any]:
         """Process multiple public documents in parallel"""
         results = {'successful': [], 'failed': []}
-        
+
         try:
-            documents = PublicDocument.objects.filter(id__in=document_ids)
-            
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            titles = {
+                str(doc_id): title
+                for doc_id, title in PublicDocument.objects.filter(
+                    id__in=document_ids
+                ).values_list('id', 'title')
+            }
+
+            # One UPDATE marks the whole batch as processing instead of
+            # one round-trip per document inside the workers
+            PublicDocument.objects.filter(id__in=list(titles)).update(
+                processing_status='processing'
+            )
+
+            # Close connections before forking so each child opens its
+            # own instead of sharing the parent's socket
+            connections.close_all()
+
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all tasks
-                future_to_doc = {
-                    executor.submit(self.public_processor.process_document, doc): doc
-                    for doc in documents
+                future_to_id = {
+                    executor.submit(_process_public_document_worker, doc_id): doc_id
+                    for doc_id in titles
                 }
-                
+
                 # Collect results
-                for future in as_completed(future_to_doc):
-                    doc = future_to_doc[future]
+                for future in as_completed(future_to_id):
+                    doc_id = future_to_id[future]
                     try:
                         result = future.result()
                         if result['success']:
                             results['successful'].append({
-                                'document_id': str(doc.id),
-                                'title': doc.title,
+                                'document_id': doc_id,
+                                'title': titles[doc_id],
                                 'result': result
                             })
                         else:
                             results['failed'].append({
-                                'document_id': str(doc.id),
-                                'title': doc.title,
+                                'document_id': doc_id,
+                                'title': titles[doc_id],
                                 'error': result['error']
                             })
                     except Exception as e:
                         results['failed'].append({
-                            'document_id': str(doc.id),
-                            'title': doc.title,
+                            'document_id': doc_id,
+                            'title': titles[doc_id],
                             'error': str(e)
                         })
-            
+
             return results
-            
+
         except Exception as e:
             logger.error(f"Batch processing failed: {str(e)}")
             return {'successful': [], 'failed': [], 'error': str(e)}
-    
+
     def process_user_documents(self, user, document_ids: List[str]) -> Dict[str, Any]:
         """Process multiple user documents in parallel"""
         results = {'successful': [], 'failed': []}
-        
+
         try:
-            documents = UserDocument.objects.filter(
-                id__in=document_ids, 
-                user=user
+            file_names = {
+                str(doc_id): file_name
+                for doc_id, file_name in UserDocument.objects.filter(
+                    id__in=document_ids,
+                    user=user
+                ).values_list('id', 'file_name')
+            }
+
+            # Single batch-wide status UPDATE, mirroring the public path
+            UserDocument.objects.filter(id__in=list(file_names)).update(
+                status='processing'
             )
-            
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            connections.close_all()
+
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
                 # Submit all tasks
-                future_to_doc = {
-                    executor.submit(self.personal_processor.process_document, doc): doc
-                    for doc in documents
+                future_to_id = {
+                    executor.submit(_process_user_document_worker, doc_id, str(user.id)): doc_id
+                    for doc_id in file_names
                 }
-                
+
                 # Collect results
-                for future in as_completed(future_to_doc):
-                    doc = future_to_doc[future]
+                for future in as_completed(future_to_id):
+                    doc_id = future_to_id[future]
                     try:
                         result = future.result()
                         if result['success']:
                             results['successful'].append({
-                                'document_id': str(doc.id),
-                                'file_name': doc.file_name,
+                                'document_id': doc_id,
+                                'file_name': file_names[doc_id],
                                 'result': result
                             })
                         else:
                             results['failed'].append({
-                                'document_id': str(doc.id),
-                                'file_name': doc.file_name,
+                                'document_id': doc_id,
+                                'file_name': file_names[doc_id],
                                 'error': result['error']
                             })
                     except Exception as e:
                         results['failed'].append({
-                            'document_id': str(doc.id),
-                            'file_name': doc.file_name,
+                            'document_id': doc_id,
+                            'file_name': file_names[doc_id],
                             'error': str(e)
                         })
-            
+
             return results
-            
+
         except Exception as e:
             logger.error(f"User batch processing failed: {str(e)}")
             return {'successful': [], 'failed': [], 'error': str(e)}
@@ -677,7 +1374,7 @@ class CleanupProcessor:
             )
             
             cleaned_count = 0
-            for task in failed_tasks:
+            for task in chunked(failed_tasks):
                 try:
                     # Clean up associated data
                     if task.user_document:
@@ -1,17 +1,39 @@
 # Security Module - Authentication, validation, and audit logging
 
+import json
 import logging
 import hashlib
 import hmac
 import os
+import re
+import queue
+import threading
+import time
 from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
 from django.conf import settings
 from django.core.cache import cache
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import UploadedFile
 import magic
+import redis
+
+from .models import ChatSession, UserDocument
+
+try:
+    import ahocorasick  # Single-pass multi-pattern scan for upload content
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan  # Compiled-DFA scan; fastest upload-scan backend
+except ImportError:
+    hyperscan = None
+
+try:
+    import xxhash  # Fast non-cryptographic session fingerprint hash
+except ImportError:
+    xxhash = None
 
 logger = logging.getLogger(__name__)
 security_logger = logging.getLogger('security_audit')
@@ -22,6 +44,152 @@ User = get_user_model()
 # FILE VALIDATION
 # ============================================================================
 
+# Upload policy tables, built once instead of per request
+_ALLOWED_EXTENSIONS = ('.pdf', '.docx', '.doc', '.txt')
+_ALLOWED_MIME_TYPES = {
+    '.pdf': frozenset({'application/pdf'}),
+    '.docx': frozenset({'application/vnd.openxmlformats-officedocument.wordprocessingml.document'}),
+    '.doc': frozenset({'application/msword'}),
+    '.txt': frozenset({'text/plain'})
+}
+
+# Characters replaced in client-supplied filenames; a translate table is
+# a single C-level pass, no regex engine involved
+_UNSAFE_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# libmagic cookies are not shareable across threads, so each thread keeps
+# its own; magic.from_buffer would reload the magic database per call
+_magic_local = threading.local()
+
+
+def _get_mime_sniffer() -> magic.Magic:
+    """Per-thread persistent libmagic handle"""
+    sniffer = getattr(_magic_local, 'sniffer', None)
+    if sniffer is None:
+        sniffer = magic.Magic(mime=True)
+        _magic_local.sniffer = sniffer
+    return sniffer
+
+# Content patterns that flag an upload as potentially malicious (all
+# lowercase; scanned against lowercased content)
+_MALICIOUS_PATTERNS = (
+    b'<script',
+    b'javascript:',
+    b'vbscript:',
+    b'onload=',
+    b'onerror=',
+    b'<?php',
+    b'<%',
+    b'exec(',
+    b'system(',
+    b'shell_exec('
+)
+
+
+def _build_malicious_automaton():
+    """Aho-Corasick automaton over the pattern set, or None without the lib"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for pattern in _MALICIOUS_PATTERNS:
+        automaton.add_word(pattern.decode('ascii'), pattern)
+    automaton.make_automaton()
+    return automaton
+
+
+_MALICIOUS_AUTOMATON = _build_malicious_automaton()
+
+
+def _build_malicious_hs_db():
+    """Hyperscan database over the pattern set, or None without the lib"""
+    if hyperscan is None:
+        return None
+    try:
+        db = hyperscan.Database()
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+        db.compile(
+            expressions=[re.escape(pattern) for pattern in _MALICIOUS_PATTERNS],
+            ids=list(range(len(_MALICIOUS_PATTERNS))),
+            flags=[flags] * len(_MALICIOUS_PATTERNS)
+        )
+        return db
+    except Exception as e:
+        logger.warning(f"Hyperscan database build failed: {e}")
+        return None
+
+
+_MALICIOUS_HS_DB = _build_malicious_hs_db()
+
+# Hyperscan scratch space is per-thread, not shareable
+_hs_local = threading.local()
+
+
+def _hs_scan(buf: bytes) -> bool:
+    """Scan a buffer against the compiled Hyperscan database"""
+    scratch = getattr(_hs_local, 'scratch', None)
+    if scratch is None:
+        scratch = hyperscan.Scratch(_MALICIOUS_HS_DB)
+        _hs_local.scratch = scratch
+    matched = []
+    _MALICIOUS_HS_DB.scan(
+        buf,
+        match_event_handler=lambda *args: matched.append(1),
+        scratch=scratch
+    )
+    return bool(matched)
+
+# Case-insensitive alternation fallback when pyahocorasick is missing;
+# compiled once, still a single pass per buffer
+_MALICIOUS_RE = re.compile(
+    b'(?i)' + b'|'.join(re.escape(pattern) for pattern in _MALICIOUS_PATTERNS)
+)
+
+# Streaming scan parameters: buffers never exceed the chunk size plus the
+# overlap carried to catch patterns straddling a chunk boundary
+_SCAN_CHUNK_SIZE = 64 * 1024
+_SCAN_OVERLAP = max(len(pattern) for pattern in _MALICIOUS_PATTERNS) - 1
+
+
+def _contains_malicious_pattern(content: bytes) -> bool:
+    """Scan a buffer for malicious patterns in a single pass
+
+    Backends in descending preference: Hyperscan's compiled DFA, the
+    Aho-Corasick automaton, then one compiled alternation search. All
+    check every pattern in one traversal over the buffer.
+    """
+    if _MALICIOUS_HS_DB is not None:
+        try:
+            return _hs_scan(content)
+        except Exception as e:
+            logger.warning(f"Hyperscan scan failed: {e}")
+    if _MALICIOUS_AUTOMATON is not None:
+        return next(
+            _MALICIOUS_AUTOMATON.iter(content.lower().decode('latin-1')), None
+        ) is not None
+    return _MALICIOUS_RE.search(content) is not None
+
+
+def _stream_scan_malicious(uploaded_file: UploadedFile, head: bytes = b'') -> bool:
+    """Scan an upload in fixed-size chunks without loading it into memory
+
+    Large uploads spill to disk as TemporaryUploadedFile; reading them
+    whole costs a file-sized allocation per request. A trailing overlap of
+    the previous chunk catches patterns straddling chunk boundaries. An
+    already-read head chunk can be passed in so callers that sniffed the
+    file type don't re-read those bytes.
+    """
+    if head and _contains_malicious_pattern(head):
+        return True
+    tail = head[-_SCAN_OVERLAP:]
+    while True:
+        chunk = uploaded_file.read(_SCAN_CHUNK_SIZE)
+        if not chunk:
+            return False
+        buf = tail + chunk
+        if _contains_malicious_pattern(buf):
+            return True
+        tail = buf[-_SCAN_OVERLAP:]
+
 def validate_file_upload(uploaded_file: UploadedFile) -> Dict[str, Any]:
     """Comprehensive file upload validation"""
     try:
@@ -34,70 +202,57 @@ def validate_file_upload(uploaded_file: UploadedFile) -> Dict[str, Any]:
             }
         
         # Check file extension
-        allowed_extensions = ['.pdf', '.docx', '.doc', '.txt']
         file_ext = os.path.splitext(uploaded_file.name)[1].lower()
-        
-        if file_ext not in allowed_extensions:
+
+        if file_ext not in _ALLOWED_EXTENSIONS:
             return {
                 'valid': False,
-                'error': f'File type {file_ext} not allowed. Allowed types: {", ".join(allowed_extensions)}'
+                'error': f'File type {file_ext} not allowed. Allowed types: {", ".join(_ALLOWED_EXTENSIONS)}'
             }
-        
-        # Check MIME type
+
+        # One streamed pass covers both content checks: the head chunk
+        # feeds the MIME sniff and seeds the pattern scan, so file bytes
+        # are read once and the pointer is reset once at the end
         try:
-            # Read first chunk to determine MIME type
-            chunk = uploaded_file.read(1024)
+            head = uploaded_file.read(_SCAN_CHUNK_SIZE)
+
+            try:
+                if file_ext == '.txt':
+                    # Plain text needs no magic-database walk: a NUL byte
+                    # in the head marks binary content, and the pattern
+                    # scan below covers everything else
+                    if b'\x00' in head[:1024]:
+                        uploaded_file.seek(0)  # Reset file pointer
+                        return {
+                            'valid': False,
+                            'error': 'File content does not match extension. Expected text content for .txt'
+                        }
+                else:
+                    mime_type = _get_mime_sniffer().from_buffer(head[:1024])
+
+                    if mime_type not in _ALLOWED_MIME_TYPES.get(file_ext, ()):
+                        uploaded_file.seek(0)  # Reset file pointer
+                        return {
+                            'valid': False,
+                            'error': f'File content does not match extension. Expected MIME type for {file_ext}, got {mime_type}'
+                        }
+
+            except Exception as e:
+                logger.warning(f"MIME type validation failed: {e}")
+                # Continue without MIME validation if magic fails
+
+            malicious = _stream_scan_malicious(uploaded_file, head=head)
             uploaded_file.seek(0)  # Reset file pointer
-            
-            mime_type = magic.from_buffer(chunk, mime=True)
-            
-            allowed_mime_types = {
-                '.pdf': ['application/pdf'],
-                '.docx': ['application/vnd.openxmlformats-officedocument.wordprocessingml.document'],
-                '.doc': ['application/msword'],
-                '.txt': ['text/plain']
-            }
-            
-            if mime_type not in allowed_mime_types.get(file_ext, []):
+
+            if malicious:
                 return {
                     'valid': False,
-                    'error': f'File content does not match extension. Expected MIME type for {file_ext}, got {mime_type}'
+                    'error': 'File contains potentially malicious content'
                 }
-                
-        except Exception as e:
-            logger.warning(f"MIME type validation failed: {e}")
-            # Continue without MIME validation if magic fails
-        
-        # Check for malicious content patterns
-        malicious_patterns = [
-            b'<script',
-            b'javascript:',
-            b'vbscript:',
-            b'onload=',
-            b'onerror=',
-            b'<?php',
-            b'<%',
-            b'exec(',
-            b'system(',
-            b'shell_exec('
-        ]
-        
-        # Read file content for pattern checking
-        try:
-            uploaded_file.seek(0)
-            content = uploaded_file.read()
-            uploaded_file.seek(0)  # Reset file pointer
-            
-            content_lower = content.lower()
-            for pattern in malicious_patterns:
-                if pattern in content_lower:
-                    return {
-                        'valid': False,
-                        'error': 'File contains potentially malicious content'
-                    }
-                    
+
         except Exception as e:
             logger.warning(f"Content scanning failed: {e}")
+            uploaded_file.seek(0)
         
         return {'valid': True}
         
@@ -111,13 +266,11 @@ def validate_file_upload(uploaded_file: UploadedFile) -> Dict[str, Any]:
 
 def sanitize_filename(filename: str) -> str:
     """Sanitize filename to prevent path traversal and other attacks"""
-    import re
-    
     # Remove path components
     filename = os.path.basename(filename)
-    
+
     # Remove or replace dangerous characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = filename.translate(_UNSAFE_FILENAME_TRANS)
     
     # Remove leading/trailing dots and spaces
     filename = filename.strip('. ')
@@ -138,62 +291,139 @@ def sanitize_filename(filename: str) -> str:
 # ACCESS CONTROL
 # ============================================================================
 
+# Token bucket evaluated server-side in one atomic script: a single
+# round-trip with no read-modify-write race, and refill over time smooths
+# limits instead of admitting full bursts at each window boundary
+_RATE_LIMIT_LUA = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'last_refill')
+local tokens = tonumber(bucket[1])
+local last_refill = tonumber(bucket[2])
+if tokens == nil then
+    tokens = limit
+    last_refill = now
+end
+
+tokens = math.min(limit, tokens + (now - last_refill) * limit / window)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HMSET', KEYS[1], 'tokens', tokens, 'last_refill', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(window * 1000))
+return {allowed, tostring(tokens)}
+"""
+
+_redis_client = None
+_rate_limit_script = None
+
+
+def _get_redis_client():
+    """Lazily created Redis client shared by rate limiting and event history"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(settings.REDIS_URL)
+    return _redis_client
+
+
+def _get_rate_limit_script():
+    """Token-bucket script registered once on the shared client"""
+    global _rate_limit_script
+    if _rate_limit_script is None:
+        _rate_limit_script = _get_redis_client().register_script(_RATE_LIMIT_LUA)
+    return _rate_limit_script
+
+
 def check_rate_limit(user_id: str, action: str, limit: int = 10, window: int = 60) -> Dict[str, Any]:
-    """Check rate limiting for user actions"""
+    """Check rate limiting for user actions via an atomic Redis token bucket"""
     try:
-        cache_key = f"rate_limit:{user_id}:{action}"
-        current_count = cache.get(cache_key, 0)
-        
-        if current_count >= limit:
+        allowed, tokens = _get_rate_limit_script()(
+            keys=[f"rate_limit:{user_id}:{action}"],
+            args=[limit, window, time.time()]
+        )
+        tokens = float(tokens)
+
+        if not allowed:
             return {
                 'allowed': False,
                 'error': f'Rate limit exceeded for {action}. Try again later.',
-                'retry_after': window
+                'retry_after': max(1, int((1 - tokens) * window / limit) + 1)
             }
-        
-        # Increment counter
-        cache.set(cache_key, current_count + 1, timeout=window)
-        
+
         return {
             'allowed': True,
-            'remaining': limit - current_count - 1
+            'remaining': int(tokens)
         }
-        
+
     except Exception as e:
         logger.error(f"Rate limiting error: {e}")
         # Allow on error to prevent blocking legitimate users
         return {'allowed': True, 'remaining': limit}
 
 
+# Owner lookups repeat heavily when a view checks several resources in
+# one burst; a short TTL coalesces them without holding stale ownership
+# for long
+_OWNER_CACHE_TTL = 5  # seconds
+_OWNER_CACHE_MAX = 4096
+_owner_cache: Dict[Any, Any] = {}
+_owner_cache_lock = threading.Lock()
+
+
+def _cached_owner_id(resource_type: str, resource_id: str, fetch):
+    """Owner id for a resource, briefly cached; None when it doesn't exist"""
+    key = (resource_type, str(resource_id))
+    now = time.monotonic()
+    entry = _owner_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    owner_id = fetch()
+    with _owner_cache_lock:
+        if len(_owner_cache) >= _OWNER_CACHE_MAX:
+            _owner_cache.clear()
+        _owner_cache[key] = (now + _OWNER_CACHE_TTL, owner_id)
+    return owner_id
+
+
 def validate_user_access(user, resource_type: str, resource_id: str = None) -> bool:
     """Validate user access to resources"""
     try:
         if not user or not user.is_authenticated:
             return False
-        
+
         # Admin users have access to everything
         if user.is_staff or user.is_superuser:
             return True
-        
-        # Resource-specific access control
+
+        # Resource-specific access control. Ownership checks fetch only
+        # the owner column instead of instantiating the full model
         if resource_type == 'user_document':
             if resource_id:
-                from .models import UserDocument
-                try:
-                    document = UserDocument.objects.get(id=resource_id)
-                    return document.user_id == user.id
-                except UserDocument.DoesNotExist:
-                    return False
+                owner_id = _cached_owner_id(
+                    'user_document', resource_id,
+                    lambda: UserDocument.objects.filter(
+                        id=resource_id
+                    ).values_list('user_id', flat=True).first()
+                )
+                return owner_id == user.id
             return True  # User can access their own documents
-        
+
         elif resource_type == 'chat_session':
             if resource_id:
-                from .models import ChatSession
-                try:
-                    session = ChatSession.objects.get(id=resource_id)
-                    return session.user_id == user.id
-                except ChatSession.DoesNotExist:
-                    return False
+                owner_id = _cached_owner_id(
+                    'chat_session', resource_id,
+                    lambda: ChatSession.objects.filter(
+                        id=resource_id
+                    ).values_list('user_id', flat=True).first()
+                )
+                return owner_id == user.id
             return True  # User can access their own sessions
         
         elif resource_type == 'public_document':
@@ -213,6 +443,95 @@ def validate_user_access(user, resource_type: str, resource_id: str = None) -> b
 # SECURITY LOGGING
 # ============================================================================
 
+# Events are buffered in-process and flushed together shortly after the
+# first append, so a burst of events costs one batched cache write
+# instead of a read-modify-write round-trip each
+_EVENT_FLUSH_INTERVAL = 0.05  # seconds
+_EVENT_HISTORY_SIZE = 100
+# Bounded queue consumed by one daemon flusher thread: the request path
+# only enqueues, and overload drops events with a warning instead of
+# growing memory or blocking the request
+_EVENT_QUEUE_SIZE = 10000
+_EVENT_FLUSH_BATCH = 200
+_event_queue: 'queue.Queue' = queue.Queue(maxsize=_EVENT_QUEUE_SIZE)
+_event_worker_started = False
+_event_worker_lock = threading.Lock()
+
+
+def _flush_security_events(pending: Dict[str, List[Dict[str, Any]]]):
+    """Push a batch of events with one pipeline of Redis stream appends
+
+    XADD with an approximate maxlen keeps the capped history server-side
+    with amortized O(1) trimming — only the new entries cross the wire,
+    never the existing history.
+    """
+    try:
+        pipe = _get_redis_client().pipeline(transaction=False)
+        for key, events in pending.items():
+            for event in events:
+                pipe.xadd(
+                    key,
+                    {'data': json.dumps(event, default=str)},
+                    maxlen=_EVENT_HISTORY_SIZE,
+                    approximate=True
+                )
+            pipe.expire(key, 86400)  # 24 hours
+        pipe.execute()
+
+    except Exception as e:
+        logger.error(f"Security event flush error: {e}")
+
+
+def _drain_event_queue():
+    """Flusher loop: gather a batch per interval, write it in one pipeline"""
+    while True:
+        try:
+            key, event = _event_queue.get()
+            pending = {key: [event]}
+            count = 1
+            deadline = time.monotonic() + _EVENT_FLUSH_INTERVAL
+            while count < _EVENT_FLUSH_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    key, event = _event_queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                pending.setdefault(key, []).append(event)
+                count += 1
+
+            _flush_security_events(pending)
+
+        except Exception as e:
+            logger.error(f"Security event worker error: {e}")
+
+
+def _ensure_event_worker():
+    """Start the flusher thread on first use"""
+    global _event_worker_started
+    if _event_worker_started:
+        return
+    with _event_worker_lock:
+        if not _event_worker_started:
+            worker = threading.Thread(
+                target=_drain_event_queue,
+                name='security-event-flusher',
+                daemon=True
+            )
+            worker.start()
+            _event_worker_started = True
+
+
+def _queue_security_event(cache_key: str, event_data: Dict[str, Any]):
+    """Hand an event to the background flusher without blocking"""
+    _ensure_event_worker()
+    try:
+        _event_queue.put_nowait((cache_key, event_data))
+    except queue.Full:
+        security_logger.warning("Security event queue full; event history entry dropped")
+
+
 def log_security_event(event_type: str, user, **kwargs):
     """Log security-related events for audit trail"""
     try:
@@ -221,24 +540,22 @@ def log_security_event(event_type: str, user, **kwargs):
             'user_id': str(user.id) if user else 'anonymous',
             'phone_number': user.phone_number if user and hasattr(user, 'phone_number') else 'unknown',
             'timestamp': timezone.now().isoformat(),
+            # Epoch seconds alongside the ISO string so age checks are an
+            # integer subtraction instead of a datetime parse
+            'ts': int(time.time()),
             'ip_address': kwargs.get('ip_address', 'unknown'),
             **kwargs
         }
-        
+
         # Log to security audit logger
         security_logger.info(f"SECURITY_EVENT: {event_type}", extra=event_data)
-        
-        # Store in cache for recent events (last 24 hours)
+
+        # Enqueue for the recent-events history (last 24 hours); the
+        # background flusher batches writes so this call never waits on
+        # the cache
         cache_key = f"security_events:{user.id if user else 'anonymous'}"
-        recent_events = cache.get(cache_key, [])
-        recent_events.append(event_data)
-        
-        # Keep only last 100 events
-        if len(recent_events) > 100:
-            recent_events = recent_events[-100:]
-        
-        cache.set(cache_key, recent_events, timeout=86400)  # 24 hours
-        
+        _queue_security_event(cache_key, event_data)
+
     except Exception as e:
         logger.error(f"Security logging error: {e}")
 
@@ -246,10 +563,15 @@ def log_security_event(event_type: str, user, **kwargs):
 def get_security_events(user, limit: int = 50) -> List[Dict[str, Any]]:
     """Get recent security events for a user"""
     try:
-        cache_key = f"security_events:{user.id}"
-        events = cache.get(cache_key, [])
-        return events[-limit:] if events else []
-        
+        entries = _get_redis_client().xrevrange(
+            f"security_events:{user.id}", count=limit
+        )
+        # xrevrange yields newest first; reverse back to chronological
+        # order with the most recent event last
+        return [
+            json.loads(fields[b'data']) for _, fields in reversed(entries)
+        ]
+
     except Exception as e:
         logger.error(f"Failed to retrieve security events: {e}")
         return []
@@ -259,21 +581,49 @@ def get_security_events(user, limit: int = 50) -> List[Dict[str, Any]]:
 # DATA ENCRYPTION
 # ============================================================================
 
+# Precomputed HMAC pads: hmac.new re-runs the ipad/opad key schedule (two
+# SHA-256 block compressions) on every call, which dominates the cost of
+# signing short payloads. The inner/outer states per key are hashed once
+# and copied per call; going through hashlib.sha256 directly also
+# guarantees OpenSSL's vectorized SHA-256 regardless of the hmac
+# module's backend.
+_SHA256_BLOCK_SIZE = 64
+_hmac_pads: Dict[str, Any] = {}
+
+
+def _build_hmac_pads(key: str):
+    """Precompute inner/outer SHA-256 states for a key (RFC 2104)"""
+    key_bytes = key.encode('utf-8')
+    if len(key_bytes) > _SHA256_BLOCK_SIZE:
+        key_bytes = hashlib.sha256(key_bytes).digest()
+    key_bytes = key_bytes.ljust(_SHA256_BLOCK_SIZE, b'\x00')
+    inner = hashlib.sha256(bytes(b ^ 0x36 for b in key_bytes))
+    outer = hashlib.sha256(bytes(b ^ 0x5C for b in key_bytes))
+    return inner, outer
+
+
+def _sign_bytes(data: str, key: Optional[str] = None) -> bytes:
+    """Raw 32-byte HMAC-SHA256 of data; hex only at storage boundaries"""
+    if not key:
+        key = getattr(settings, 'HMAC_SECRET_KEY', settings.SECRET_KEY)
+
+    pads = _hmac_pads.get(key)
+    if pads is None:
+        pads = _build_hmac_pads(key)
+        _hmac_pads[key] = pads
+
+    inner = pads[0].copy()
+    inner.update(data.encode('utf-8'))
+    outer = pads[1].copy()
+    outer.update(inner.digest())
+    return outer.digest()
+
+
 def encrypt_sensitive_data(data: str, key: Optional[str] = None) -> str:
     """Encrypt sensitive data using HMAC"""
     try:
-        if not key:
-            key = getattr(settings, 'HMAC_SECRET_KEY', settings.SECRET_KEY)
-        
-        # Create HMAC hash
-        signature = hmac.new(
-            key.encode('utf-8'),
-            data.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        
-        return signature
-        
+        return _sign_bytes(data, key).hex()
+
     except Exception as e:
         logger.error(f"Data encryption error: {e}")
         return ""
@@ -282,9 +632,13 @@ def encrypt_sensitive_data(data: str, key: Optional[str] = None) -> str:
 def verify_data_integrity(data: str, signature: str, key: Optional[str] = None) -> bool:
     """Verify data integrity using HMAC"""
     try:
-        expected_signature = encrypt_sensitive_data(data, key)
-        return hmac.compare_digest(signature, expected_signature)
-        
+        # Compare the raw 32-byte digests; decoding the stored hex once
+        # halves the constant-time comparison length
+        return hmac.compare_digest(bytes.fromhex(signature), _sign_bytes(data, key))
+
+    except ValueError:
+        # Stored signature isn't valid hex — cannot match any digest
+        return False
     except Exception as e:
         logger.error(f"Data verification error: {e}")
         return False
@@ -294,30 +648,53 @@ def verify_data_integrity(data: str, signature: str, key: Optional[str] = None)
 # SESSION SECURITY
 # ============================================================================
 
+# Seed for the fingerprint hash; fixed so values survive process restarts
+_FINGERPRINT_SEED = 0x1A3D
+
+
+def _fingerprint_hash(value: str) -> int:
+    """64-bit fingerprint of a request attribute
+
+    Fingerprints are compared for equality, never inverted, so a fast
+    non-cryptographic hash replaces the SHA-256 + hex-slice the check
+    used to pay per request.
+    """
+    if xxhash is not None:
+        return xxhash.xxh3_64(value.encode(), seed=_FINGERPRINT_SEED).intdigest()
+    return int.from_bytes(
+        hashlib.blake2b(value.encode(), digest_size=8).digest(), 'big'
+    )
+
+
 def validate_session_security(request) -> Dict[str, Any]:
     """Validate session security parameters"""
     try:
         # Check for session hijacking indicators
         user_agent = request.META.get('HTTP_USER_AGENT', '')
         ip_address = get_client_ip(request)
-        
+
         # Store session fingerprint
         session_key = request.session.session_key
         if session_key:
             fingerprint = {
-                'user_agent_hash': hashlib.sha256(user_agent.encode()).hexdigest()[:16],
+                'user_agent_hash': _fingerprint_hash(user_agent),
                 'ip_address': ip_address,
                 'created_at': timezone.now().isoformat()
             }
-            
+
             cache_key = f"session_fingerprint:{session_key}"
             stored_fingerprint = cache.get(cache_key)
-            
+
             if stored_fingerprint:
+                stored_hash = stored_fingerprint['user_agent_hash']
+                if not isinstance(stored_hash, int):
+                    # Fingerprint from before the hash switch; re-store
+                    # rather than treating the format change as a hijack
+                    cache.set(cache_key, fingerprint, timeout=86400)  # 24 hours
                 # Check for changes that might indicate hijacking
-                if (stored_fingerprint['user_agent_hash'] != fingerprint['user_agent_hash'] or
-                    stored_fingerprint['ip_address'] != fingerprint['ip_address']):
-                    
+                elif (stored_hash != fingerprint['user_agent_hash'] or
+                      stored_fingerprint['ip_address'] != fingerprint['ip_address']):
+
                     return {
                         'valid': False,
                         'reason': 'Session fingerprint mismatch',
@@ -326,9 +703,9 @@ def validate_session_security(request) -> Dict[str, Any]:
             else:
                 # Store new fingerprint
                 cache.set(cache_key, fingerprint, timeout=86400)  # 24 hours
-        
+
         return {'valid': True}
-        
+
     except Exception as e:
         logger.error(f"Session validation error: {e}")
         return {'valid': True}  # Allow on error
@@ -355,11 +732,11 @@ def check_suspicious_activity(user, action: str, **kwargs) -> bool:
         recent_events = get_security_events(user, limit=20)
         
         # Check for rapid successive actions
-        now = timezone.now()
+        now_ts = int(time.time())
         recent_actions = [
             event for event in recent_events
             if event.get('event_type') == action and
-            (now - datetime.fromisoformat(event['timestamp'])).total_seconds() < 300  # 5 minutes
+            now_ts - event.get('ts', 0) < 300  # 5 minutes
         ]
         
         # Flag if more than 10 similar actions in 5 minutes
@@ -384,28 +761,40 @@ def check_suspicious_activity(user, action: str, **kwargs) -> bool:
 # SECURITY CONFIGURATION VALIDATION
 # ============================================================================
 
+# Settings are immutable at runtime, so the verdict is computed once;
+# only the timestamp is fresh per call
+_security_config_result = None
+
+
 def validate_security_configuration() -> Dict[str, Any]:
     """Validate security configuration on startup"""
-    issues = []
-    
-    # Check secret key
-    if not settings.SECRET_KEY or settings.SECRET_KEY == 'django-insecure-default':
-        issues.append("Django SECRET_KEY is not set or using default value")
-    
-    # Check debug mode in production
-    if settings.DEBUG and not settings.ALLOWED_HOSTS == ['*']:
-        issues.append("DEBUG mode should be False in production")
-    
-    # Check HTTPS settings
-    if not settings.SECURE_SSL_REDIRECT and not settings.DEBUG:
-        issues.append("SECURE_SSL_REDIRECT should be True in production")
-    
-    # Check database encryption
-    if not getattr(settings, 'ENCRYPTION_MASTER_KEY', None):
-        issues.append("ENCRYPTION_MASTER_KEY not configured")
-    
+    global _security_config_result
+
+    if _security_config_result is None:
+        issues = []
+
+        # Check secret key
+        if not settings.SECRET_KEY or settings.SECRET_KEY == 'django-insecure-default':
+            issues.append("Django SECRET_KEY is not set or using default value")
+
+        # Check debug mode in production
+        if settings.DEBUG and not settings.ALLOWED_HOSTS == ['*']:
+            issues.append("DEBUG mode should be False in production")
+
+        # Check HTTPS settings
+        if not settings.SECURE_SSL_REDIRECT and not settings.DEBUG:
+            issues.append("SECURE_SSL_REDIRECT should be True in production")
+
+        # Check database encryption
+        if not getattr(settings, 'ENCRYPTION_MASTER_KEY', None):
+            issues.append("ENCRYPTION_MASTER_KEY not configured")
+
+        _security_config_result = {
+            'valid': len(issues) == 0,
+            'issues': issues
+        }
+
     return {
-        'valid': len(issues) == 0,
-        'issues': issues,
+        **_security_config_result,
         'timestamp': timezone.now().isoformat()
     }
\ No newline at end of file
@@ -3,7 +3,14 @@ Segregated Hybrid Retrieval System for Legal AI Assistant.
 Implements multi-source queries with strict data segregation between personal and public knowledge.
 """
 
+import hashlib
 import logging
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import uuid
@@ -20,15 +27,165 @@ from .models import User, UserPartition
 from .cache_manager import cache_manager, cache_result
 from .performance_monitor import performance_monitor, monitor_performance
 
+try:
+    import ahocorasick  # Single-pass multi-term scan for entity extraction
+except ImportError:
+    ahocorasick = None
+
+try:
+    # int8 ONNX Runtime path for the reranker; roughly doubles CPU
+    # throughput over FP32 PyTorch via VNNI/AVX-512 int8 kernels
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+except ImportError:
+    ORTModelForSequenceClassification = None
+
 logger = logging.getLogger(__name__)
 
+# Entity-extraction patterns, compiled once at import instead of per query
+_ARTICLE_RE = re.compile(r'\b[Aa]rticle\s+(\d+)\b')
+_CASE_RE = re.compile(r'\b([A-Z][a-z]+\s+v\.?\s+[A-Z][a-z]+)\b')
+
+_LEGAL_TERMS = (
+    'fundamental rights', 'directive principles', 'emergency provisions',
+    'parliament', 'supreme court', 'high court', 'president', 'governor',
+    'constitution', 'amendment', 'equality', 'liberty', 'justice'
+)
+
+
+def _build_legal_term_automaton():
+    """Build the Aho-Corasick automaton over the legal-term vocabulary
+
+    One DFA pass over the query replaces a substring scan per term, so
+    extraction stays O(len(query)) as the vocabulary grows.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in _LEGAL_TERMS:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
+
+_LEGAL_TERM_AUTOMATON = _build_legal_term_automaton()
+
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _normalize_query(query: str) -> str:
+    """Collapse whitespace and case so trivial variants share cache entries"""
+    return _WHITESPACE_RE.sub(' ', query.strip().lower())
+
+
+def _query_hash(query: str) -> str:
+    """Deterministic digest of a normalized query for cache keys
+
+    Python's builtin hash() is salted per process, so keys built from it
+    can never hit across workers; BLAKE2b on short strings is close to
+    memcpy-bound and stable everywhere.
+    """
+    return hashlib.blake2b(_normalize_query(query).encode(), digest_size=16).hexdigest()
+
+
+# Field names allowed into a Milvus boolean expression; anything else
+# could smuggle operators into the filter
+_EXPR_FIELD_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+
+def _quote_expr_value(value: Any) -> str:
+    """Escape a value for a single-quoted Milvus expression literal
+
+    Backslashes and quotes are escaped so a crafted filter value cannot
+    terminate the literal and rewrite the expression — in particular the
+    user_id predicate that enforces personal-data segregation.
+    """
+    return str(value).replace('\\', '\\\\').replace("'", "\\'")
+
+
+def _build_filter_parts(filters: Optional[Dict], reserved: Tuple[str, ...] = ()) -> List[str]:
+    """Turn a filters dict into escaped equality predicates
+
+    Skips reserved and '_'-prefixed keys (search knobs), drops keys that
+    are not plain identifiers, and escapes every value.
+    """
+    parts = []
+    for key, value in (filters or {}).items():
+        if key in reserved or key.startswith('_'):
+            continue
+        if not _EXPR_FIELD_RE.match(key):
+            logger.warning(f"Ignoring filter with invalid field name: {key!r}")
+            continue
+        parts.append(f"{key} == '{_quote_expr_value(value)}'")
+    return parts
+
+
+class _OnnxCrossEncoder:
+    """Drop-in predict() replacement running the reranker as int8 ONNX
+
+    Exports the cross-encoder once, applies dynamic int8 quantization,
+    and caches the result on disk so later processes skip the export.
+    Only the predict() subset used by _rerank_contexts is implemented.
+    """
+
+    def __init__(self, model_name: str, max_length: int = 256):
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+
+        quant_dir = os.path.join(
+            tempfile.gettempdir(),
+            f"ort_int8_{model_name.replace('/', '_')}"
+        )
+        if not os.path.exists(os.path.join(quant_dir, 'model_quantized.onnx')):
+            exported = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+            quantizer = ORTQuantizer.from_pretrained(exported)
+            # Dynamic quantization: weights stored int8, activations
+            # quantized on the fly — no calibration set needed
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=quant_dir, quantization_config=qconfig)
+
+        self.model = ORTModelForSequenceClassification.from_pretrained(
+            quant_dir,
+            file_name='model_quantized.onnx',
+            provider='CPUExecutionProvider'
+        )
+
+    def predict(self, pairs, batch_size: int = 32, show_progress_bar: bool = False,
+                convert_to_numpy: bool = True) -> np.ndarray:
+        """Score (query, text) pairs in batches, mirroring CrossEncoder.predict"""
+        scores = []
+        for start in range(0, len(pairs), batch_size):
+            batch = pairs[start:start + batch_size]
+            inputs = self.tokenizer(
+                [pair[0] for pair in batch],
+                [pair[1] for pair in batch],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors='np'
+            )
+            logits = self.model(**inputs).logits
+            scores.append(np.asarray(logits, dtype=np.float32).reshape(len(batch), -1)[:, 0])
+        if not scores:
+            return np.empty(0, dtype=np.float32)
+        return np.concatenate(scores)
+
 
 class SegregatedRetriever:
     """
     Manages segregated retrieval across public and personal knowledge planes.
     Ensures strict data segregation while providing intelligent hybrid search.
     """
-    
+
+    # Output fields requested from Milvus; hoisted so the hot search
+    # paths don't rebuild the lists per call (treat as read-only)
+    _PERSONAL_OUTPUT_FIELDS = ["document_id", "chunk_id", "text_content", "user_id", "created_at"]
+    _PUBLIC_OUTPUT_FIELDS = ["document_id", "chunk_id", "text_content", "document_type", "legal_domain", "created_at"]
+
+    # Cosine similarity above which two contexts count as near-duplicates
+    DEDUP_SIMILARITY_THRESHOLD = 0.92
+
     def __init__(self):
         self.partition_manager = PartitionManager()
         self.neo4j_manager = get_neo4j_manager()
@@ -37,6 +194,20 @@ class SegregatedRetriever:
         self.public_collection_name = "public_legal_knowledge"
         self.personal_collection_name = "personal_documents"
         self.cache_timeout = 300  # 5 minutes for query results
+        # 'transformer' runs the full SBERT forward per query; 'static'
+        # serves queries from the token-embedding table alone
+        self.embedding_mode = getattr(settings, 'EMBEDDING_MODE', 'transformer')
+        self._static_embedding_table = None
+        self._static_tokenizer = None
+        # L1 per-process LRU over query embeddings; L2 is the shared
+        # cache keyed by normalized-query hash
+        self._query_embedding_cache: OrderedDict = OrderedDict()
+        self.query_embedding_cache_size = 4096
+        self.query_embedding_cache_ttl = 86400  # 24 hours
+        # Collections verified (indexed + loaded) once per process; the
+        # per-query has_index/load RPC pair is pure round-trip overhead
+        self._ready_collections: Dict[str, Collection] = {}
+        self._ready_collections_lock = threading.Lock()
         
         # Initialize models
         self._initialize_embedding_model()
@@ -51,32 +222,67 @@ class SegregatedRetriever:
             model_name = getattr(settings, 'EMBEDDING_MODEL', 'all-mpnet-base-v2')
             self.embedding_model = SentenceTransformer(model_name)
             logger.info(f"Initialized embedding model: {model_name}")
+            if self.embedding_mode == 'static':
+                self._initialize_static_embeddings()
         except Exception as e:
             logger.error(f"Failed to initialize embedding model: {e}")
             raise
+
+    def _initialize_static_embeddings(self):
+        """
+        Extract the token-embedding table for the static query path.
+
+        Mean-pooled token embeddings skip the transformer forward entirely
+        — encoding a query becomes a table gather plus a reduction. That
+        trades ranking quality on long queries for an order-of-magnitude
+        latency drop on the short ones typical at request time, which is
+        why the mode is opt-in via settings.EMBEDDING_MODE.
+        """
+        try:
+            first_module = self.embedding_model[0]
+            weights = first_module.auto_model.embeddings.word_embeddings.weight
+            self._static_embedding_table = weights.detach().cpu().numpy().astype(np.float32)
+            self._static_tokenizer = first_module.tokenizer
+            logger.info("Initialized static embedding table for query encoding")
+        except Exception as e:
+            logger.warning(f"Static embedding init failed, using transformer path: {e}")
+            self._static_embedding_table = None
+            self._static_tokenizer = None
     
     def _initialize_cross_encoder(self):
         """Initialize the cross-encoder model for re-ranking"""
         try:
             cross_encoder_model = getattr(settings, 'CROSS_ENCODER_MODEL', 'cross-encoder/ms-marco-MiniLM-L-6-v2')
-            self.cross_encoder = CrossEncoder(cross_encoder_model)
+            if ORTModelForSequenceClassification is not None:
+                try:
+                    self.cross_encoder = _OnnxCrossEncoder(cross_encoder_model, max_length=256)
+                    logger.info(f"Initialized int8 ONNX cross-encoder: {cross_encoder_model}")
+                    return
+                except Exception as e:
+                    logger.warning(f"ONNX cross-encoder init failed, using PyTorch: {e}")
+            # max_length=256 caps attention cost at ~1/4 of the model's
+            # 512 default; rerank snippets rarely need more
+            self.cross_encoder = CrossEncoder(cross_encoder_model, max_length=256)
             logger.info(f"Initialized cross-encoder model: {cross_encoder_model}")
         except Exception as e:
             logger.warning(f"Failed to initialize cross-encoder model: {e}. Re-ranking will be disabled.")
             self.cross_encoder = None
     
     @monitor_performance('personal_query')
-    def query_personal_context(self, user_id: str, query: str, top_k: int = 5, offset: int = 0, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    def query_personal_context(self, user_id: str, query: str, top_k: int = 5, offset: int = 0, filters: Optional[Dict] = None,
+                               query_embedding: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
         """
         Retrieve personal context from user's partition with strict filtering.
-        
+
         Args:
             user_id: UUID string of the user
             query: Search query text
             top_k: Number of results to return
             offset: Offset for pagination
             filters: Additional filters for the query
-            
+            query_embedding: Precomputed embedding of query, to avoid
+                re-encoding when several branches share one query
+
         Returns:
             List of personal document contexts with metadata
         """
@@ -91,18 +297,20 @@ class SegregatedRetriever:
                 logger.warning(f"Access denied to partition {partition_name} for user {user_id}")
                 return []
             
-            # Check cache first
-            cache_key = f"personal_query_{user_id}_{hash(query)}_{top_k}_{offset}"
-            cached_result = cache_manager.get_cached_query_result(query, user_id)
+            # Check cache first; the normalized query keys the shared cache,
+            # so whitespace/case variants and other workers hit the same entry
+            normalized_query = _normalize_query(query)
+            cached_result = cache_manager.get_cached_query_result(normalized_query, user_id)
             if cached_result:
                 logger.debug(f"Retrieved personal context from cache for user {user_id}")
                 return cached_result.get('results', [])
             
-            # Generate query embedding
-            query_embedding = self._generate_query_embedding(query)
+            # Generate query embedding unless the caller already did
+            if query_embedding is None:
+                query_embedding = self._generate_query_embedding(query)
             if query_embedding is None:
                 return []
-            
+
             # Search in user's partition with pagination
             results = self._search_personal_partition(user_id, partition_name, query_embedding, top_k, offset, filters)
             
@@ -114,7 +322,7 @@ class SegregatedRetriever:
                 'user_id': user_id,
                 'query': query
             }
-            cache_manager.cache_query_result(query, user_id, result_data)
+            cache_manager.cache_query_result(normalized_query, user_id, result_data)
             
             logger.info(f"Retrieved {len(results)} personal contexts for user {user_id}")
             return results
@@ -124,16 +332,19 @@ class SegregatedRetriever:
             return []
     
     @monitor_performance('public_semantic_query')
-    def query_public_semantic(self, query: str, top_k: int = 10, offset: int = 0, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    def query_public_semantic(self, query: str, top_k: int = 10, offset: int = 0, filters: Optional[Dict] = None,
+                              query_embedding: Optional[np.ndarray] = None) -> List[Dict[str, Any]]:
         """
         Retrieve public legal knowledge using semantic search.
-        
+
         Args:
             query: Search query text
             top_k: Number of results to return
             offset: Offset for pagination
             filters: Additional filters for the query
-            
+            query_embedding: Precomputed embedding of query, to avoid
+                re-encoding when several branches share one query
+
         Returns:
             List of public document contexts with metadata
         """
@@ -143,9 +354,10 @@ class SegregatedRetriever:
             if cached_result:
                 logger.debug("Retrieved public semantic results from cache")
                 return cached_result
-            
-            # Generate query embedding
-            query_embedding = self._generate_query_embedding(query)
+
+            # Generate query embedding unless the caller already did
+            if query_embedding is None:
+                query_embedding = self._generate_query_embedding(query)
             if query_embedding is None:
                 return []
             
@@ -177,7 +389,7 @@ class SegregatedRetriever:
         try:
             # Check cache first
             entities_key = "_".join(sorted(entities))
-            cache_key = f"public_graph_{hash(entities_key)}_{hash(query)}_{limit}"
+            cache_key = f"public_graph_{_query_hash(entities_key)}_{_query_hash(query)}_{limit}"
             cached_result = cache.get(cache_key)
             if cached_result:
                 logger.debug("Retrieved public graph results from cache")
@@ -189,21 +401,26 @@ class SegregatedRetriever:
             if not entities:
                 entities = self._extract_legal_entities(query)
             
-            # Query Neo4j for each entity
-            for entity in entities[:5]:  # Limit to 5 entities to prevent excessive queries
-                entity_results = self._query_graph_for_entity(entity, limit // len(entities) + 1)
-                results.extend(entity_results)
-            
-            # Remove duplicates and limit results
-            seen_ids = set()
-            unique_results = []
+            # One UNWIND round-trip covers every entity (still capped at 5)
+            # instead of up to two queries per entity; with no entities
+            # there is nothing to query and the empty result is cached
+            if entities:
+                rows = self.neo4j_manager.query_entities_with_related(
+                    entities[:5], per_entity_limit=limit // len(entities) + 1
+                )
+                results = self._format_graph_rows(rows)
+            
+            # Remove duplicates and limit results; one insertion-ordered
+            # dict replaces the parallel seen-set and list (first
+            # occurrence of each id wins, falsy ids are dropped)
+            seen: Dict[str, Dict[str, Any]] = {}
             for result in results:
-                result_id = result.get('id', result.get('entity_id', ''))
-                if result_id and result_id not in seen_ids:
-                    seen_ids.add(result_id)
-                    unique_results.append(result)
-                    if len(unique_results) >= limit:
+                result_id = result.get('id') or result.get('entity_id')
+                if result_id and result_id not in seen:
+                    seen[result_id] = result
+                    if len(seen) >= limit:
                         break
+            unique_results = list(seen.values())
             
             # Cache results
             cache.set(cache_key, unique_results, timeout=self.cache_timeout * 4)  # 20 minutes
@@ -215,57 +432,155 @@ class SegregatedRetriever:
             logger.error(f"Error querying public graph context: {e}")
             return []
     
-    def _generate_query_embedding(self, query: str) -> Optional[List[float]]:
-        """Generate embedding for search query"""
+    def _remember_query_embedding(self, normalized_query: str, embedding: np.ndarray):
+        """Insert into the L1 LRU, evicting the oldest entry at capacity"""
+        lru = self._query_embedding_cache
+        lru[normalized_query] = embedding
+        lru.move_to_end(normalized_query)
+        if len(lru) > self.query_embedding_cache_size:
+            lru.popitem(last=False)
+
+    def _generate_query_embedding(self, query: str) -> Optional[np.ndarray]:
+        """Generate embedding for search query, cached by normalized query
+
+        Repeat queries are common (popular legal questions, retried
+        requests); a hit costs a dict or cache lookup instead of a
+        transformer forward. The vector stays an ndarray end to end —
+        Milvus accepts arrays, so there is no tolist() round-trip.
+        """
         try:
             if not self.embedding_model:
                 logger.error("Embedding model not initialized")
                 return None
-            
-            embedding = self.embedding_model.encode(query, convert_to_tensor=False)
-            return embedding.tolist()
-            
+
+            normalized_query = _normalize_query(query)
+            embedding = self._query_embedding_cache.get(normalized_query)
+            if embedding is not None:
+                self._query_embedding_cache.move_to_end(normalized_query)
+                return embedding
+
+            cache_key = f"query_emb:{hashlib.blake2b(normalized_query.encode()).hexdigest()}"
+            raw = cache.get(cache_key)
+            if raw is not None:
+                embedding = np.frombuffer(raw, dtype=np.float32)
+                self._remember_query_embedding(normalized_query, embedding)
+                return embedding
+
+            if self._static_embedding_table is not None:
+                input_ids = self._static_tokenizer(query, truncation=True)['input_ids']
+                embedding = self._static_embedding_table[input_ids].mean(axis=0)
+            else:
+                embedding = self.embedding_model.encode(query, convert_to_tensor=False)
+            # L2-normalize to match the IP metric on the collections
+            # (stored vectors are normalized at ingest)
+            embedding = np.asarray(embedding, dtype=np.float32)
+            norm = np.linalg.norm(embedding)
+            if norm > 0:
+                embedding = embedding / norm
+
+            cache.set(cache_key, embedding.tobytes(), timeout=self.query_embedding_cache_ttl)
+            self._remember_query_embedding(normalized_query, embedding)
+            return embedding
+
         except Exception as e:
             logger.error(f"Error generating query embedding: {e}")
             return None
     
-    def _search_personal_partition(self, user_id: str, partition_name: str, 
-                                 query_embedding: List[float], top_k: int, offset: int = 0, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    def encode_queries(self, queries: List[str]) -> np.ndarray:
+        """
+        Embed many queries at once with length-sorted batching.
+
+        Sorting by length keeps each batch's padding close to its longest
+        member instead of the global maximum, so bulk workloads waste far
+        fewer tokenizer and pad FLOPs; outputs are returned in input order.
+        """
+        if not queries:
+            return np.empty((0, 0), dtype=np.float32)
+
+        order = sorted(range(len(queries)), key=lambda i: len(queries[i]))
+        embeddings = self.embedding_model.encode(
+            [queries[i] for i in order],
+            batch_size=32,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        unsorted = np.empty_like(embeddings)
+        unsorted[order] = embeddings
+        return unsorted
+
+    def _get_ready_collection(self, collection_name: str) -> Optional[Collection]:
+        """Return a search-ready collection handle, verifying it at most once
+
+        has_index is a metadata RPC and load a coordinator round-trip;
+        both are idempotent, so after the first successful check the
+        cached handle is reused for the life of the process.
+        """
+        collection = self._ready_collections.get(collection_name)
+        if collection is not None:
+            return collection
+
+        with self._ready_collections_lock:
+            collection = self._ready_collections.get(collection_name)
+            if collection is not None:
+                return collection
+
+            collection = Collection(collection_name)
+            if not collection.has_index():
+                logger.warning(f"Collection {collection_name} has no index")
+                return None
+            collection.load()
+            self._ready_collections[collection_name] = collection
+            return collection
+
+    @staticmethod
+    def _resolve_ef(top_k: int, filters: Optional[Dict] = None) -> int:
+        """Pick the HNSW candidate-queue size for a search
+
+        Defaults to 4x the requested results with a floor of 64; a
+        '_ef' entry in the filters dict overrides it per request.
+        """
+        if filters and '_ef' in filters:
+            try:
+                return int(filters['_ef'])
+            except (TypeError, ValueError):
+                logger.warning(f"Ignoring non-integer _ef override: {filters['_ef']}")
+        return max(top_k * 4, 64)
+
+    def _search_personal_partition(self, user_id: str, partition_name: str,
+                                 query_embedding: np.ndarray, top_k: int, offset: int = 0, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """Search user's personal partition in Milvus"""
         try:
-            # Get personal collection
-            collection = Collection(self.personal_collection_name)
-            
-            # Ensure collection is loaded
-            if not collection.has_index():
-                logger.warning(f"Personal collection {self.personal_collection_name} has no index")
+            # Get personal collection, verified and loaded once per process
+            collection = self._get_ready_collection(self.personal_collection_name)
+            if collection is None:
                 return []
-            
-            collection.load()
-            
-            # Search parameters
+
+            # HNSW search: ef bounds the candidate queue, so it trades
+            # recall against latency; the reserved '_ef' filter key lets
+            # callers tune it per request without a redeploy
             search_params = {
-                "metric_type": "COSINE",
-                "params": {"nprobe": 10}
+                "metric_type": "IP",  # Cosine-equivalent on unit vectors
+                "params": {"ef": self._resolve_ef(top_k, filters)}
             }
-            
-            # Build expression with additional filters
-            expr = f"user_id == '{user_id}'"
-            if filters:
-                for key, value in filters.items():
-                    if key != 'user_id':  # Don't override user_id filter
-                        expr += f" and {key} == '{value}'"
-            
-            # Search with partition filter and pagination
+
+            # Build expression with additional filters; user_id is never
+            # overridable, keys are identifier-checked and values escaped
+            # so filters cannot rewrite the segregation predicate
+            parts = [f"user_id == '{_quote_expr_value(user_id)}'"]
+            parts.extend(_build_filter_parts(filters, reserved=('user_id',)))
+            expr = " and ".join(parts)
+            
+            # Search with pagination; user_id is the collection's partition
+            # key, so the expression alone routes the search to the user's
+            # hash partition — passing partition_names would be redundant
             results = collection.search(
                 data=[query_embedding],
                 anns_field="embedding",
                 param=search_params,
                 limit=top_k,
                 offset=offset,
-                partition_names=[partition_name],
                 expr=expr,
-                output_fields=["document_id", "chunk_id", "text_content", "user_id", "created_at"]
+                output_fields=self._PERSONAL_OUTPUT_FIELDS
             )
             
             # Process results
@@ -295,32 +610,28 @@ class SegregatedRetriever:
             logger.error(f"Error searching personal partition {partition_name}: {e}")
             return []
     
-    def _search_public_collection(self, query_embedding: List[float], top_k: int) -> List[Dict[str, Any]]:
+    def _search_public_collection(self, query_embedding: np.ndarray, top_k: int) -> List[Dict[str, Any]]:
         """Search public legal knowledge collection in Milvus"""
         try:
-            # Get public collection
-            collection = Collection(self.public_collection_name)
-            
-            # Ensure collection is loaded
-            if not collection.has_index():
-                logger.warning(f"Public collection {self.public_collection_name} has no index")
+            # Get public collection, verified and loaded once per process
+            collection = self._get_ready_collection(self.public_collection_name)
+            if collection is None:
                 return []
-            
-            collection.load()
-            
-            # Search parameters
+
+            # HNSW search: ef bounds the candidate queue; scale it with
+            # the requested result count
             search_params = {
-                "metric_type": "COSINE",
-                "params": {"nprobe": 16}
+                "metric_type": "IP",  # Cosine-equivalent on unit vectors
+                "params": {"ef": self._resolve_ef(top_k)}
             }
-            
+
             # Search public collection
             results = collection.search(
                 data=[query_embedding],
                 anns_field="embedding",
                 param=search_params,
                 limit=top_k,
-                output_fields=["document_id", "chunk_id", "text_content", "document_type", "legal_domain", "created_at"]
+                output_fields=self._PUBLIC_OUTPUT_FIELDS
             )
             
             # Process results
@@ -350,50 +661,39 @@ class SegregatedRetriever:
         try:
             # Simple entity extraction (in production, use NER model)
             entities = []
-            
+
             # Look for article numbers
-            import re
-            article_pattern = r'\b[Aa]rticle\s+(\d+)\b'
-            articles = re.findall(article_pattern, query)
-            entities.extend([f"Article {num}" for num in articles])
-            
+            entities.extend(f"Article {num}" for num in _ARTICLE_RE.findall(query))
+
             # Look for case names (simplified)
-            case_pattern = r'\b([A-Z][a-z]+\s+v\.?\s+[A-Z][a-z]+)\b'
-            cases = re.findall(case_pattern, query)
-            entities.extend(cases)
-            
-            # Look for common legal terms
-            legal_terms = [
-                'fundamental rights', 'directive principles', 'emergency provisions',
-                'parliament', 'supreme court', 'high court', 'president', 'governor',
-                'constitution', 'amendment', 'equality', 'liberty', 'justice'
-            ]
-            
+            entities.extend(_CASE_RE.findall(query))
+
+            # Look for common legal terms — one automaton pass when
+            # pyahocorasick is installed, per-term substring scan otherwise
             query_lower = query.lower()
-            for term in legal_terms:
-                if term in query_lower:
-                    entities.append(term)
-            
+            if _LEGAL_TERM_AUTOMATON is not None:
+                entities.extend(term for _, term in _LEGAL_TERM_AUTOMATON.iter(query_lower))
+            else:
+                entities.extend(term for term in _LEGAL_TERMS if term in query_lower)
+
             return list(set(entities))  # Remove duplicates
-            
+
         except Exception as e:
             logger.error(f"Error extracting legal entities: {e}")
             return []
     
-    def _query_graph_for_entity(self, entity: str, limit: int) -> List[Dict[str, Any]]:
-        """Query Neo4j graph for specific entity and its relationships"""
+    def _format_graph_rows(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Format batched graph rows into contexts
+
+        Each row carries a matched entity and optionally one outgoing
+        relationship; duplicated entities across rows are removed by the
+        caller's id-based dedup pass.
+        """
         try:
-            # Search for entities matching the query
-            entity_results = self.neo4j_manager.query_entities(
-                filters={'name': entity},
-                limit=limit
-            )
-            
             contexts = []
-            
-            # Process entity results
-            for entity_data in entity_results:
-                context = {
+            for row in rows:
+                entity_data = row.get('entity') or {}
+                contexts.append({
                     'source': 'public_graph',
                     'entity_id': entity_data.get('id'),
                     'entity_type': entity_data.get('entity_type', 'unknown'),
@@ -402,51 +702,28 @@ class SegregatedRetriever:
                     'text': self._format_entity_text(entity_data),
                     'score': 1.0,  # Graph results get base score
                     'metadata': entity_data
-                }
-                contexts.append(context)
-                
-                # Get related entities through relationships
-                if len(contexts) < limit:
-                    related_contexts = self._get_related_entities(entity_data.get('id'), limit - len(contexts))
-                    contexts.extend(related_contexts)
-            
-            return contexts[:limit]
-            
-        except Exception as e:
-            logger.error(f"Error querying graph for entity {entity}: {e}")
-            return []
-    
-    def _get_related_entities(self, entity_id: str, limit: int) -> List[Dict[str, Any]]:
-        """Get entities related to the given entity through relationships"""
-        try:
-            relationships = self.neo4j_manager.query_relationships(
-                source_id=entity_id,
-                limit=limit
-            )
-            
-            contexts = []
-            for rel_data in relationships:
-                target_entity = rel_data.get('target', {})
-                relationship = rel_data.get('relationship', {})
-                
-                context = {
-                    'source': 'public_graph_related',
-                    'entity_id': target_entity.get('id'),
-                    'entity_type': target_entity.get('entity_type', 'unknown'),
-                    'name': target_entity.get('name', target_entity.get('title', '')),
-                    'content': target_entity.get('content', target_entity.get('summary', '')),
-                    'text': self._format_entity_text(target_entity),
-                    'score': 0.8,  # Related entities get slightly lower score
-                    'relationship_type': relationship.get('type', 'RELATED'),
-                    'relationship_context': relationship.get('context', ''),
-                    'metadata': target_entity
-                }
-                contexts.append(context)
-            
+                })
+
+                target_entity = row.get('target')
+                if target_entity:
+                    relationship = row.get('relationship') or {}
+                    contexts.append({
+                        'source': 'public_graph_related',
+                        'entity_id': target_entity.get('id'),
+                        'entity_type': target_entity.get('entity_type', 'unknown'),
+                        'name': target_entity.get('name', target_entity.get('title', '')),
+                        'content': target_entity.get('content', target_entity.get('summary', '')),
+                        'text': self._format_entity_text(target_entity),
+                        'score': 0.8,  # Related entities get slightly lower score
+                        'relationship_type': relationship.get('type', 'RELATED'),
+                        'relationship_context': relationship.get('context', ''),
+                        'metadata': target_entity
+                    })
+
             return contexts
-            
+
         except Exception as e:
-            logger.error(f"Error getting related entities for {entity_id}: {e}")
+            logger.error(f"Error formatting graph rows: {e}")
             return []
     
     def _format_entity_text(self, entity_data: Dict[str, Any]) -> str:
@@ -574,16 +851,35 @@ class SegregatedRetriever:
             
             # Step 1: Retrieve contexts from all sources
             logger.info(f"Starting hybrid search for user {user_id}: {query}")
-            
-            # Query personal context with strict user filtering
-            personal_contexts = self.query_personal_context(user_id, query, personal_top_k)
-            
-            # Query public semantic context
-            public_semantic_contexts = self.query_public_semantic(query, public_semantic_top_k)
-            
-            # Extract entities and query graph context
-            entities = self._extract_legal_entities(query)
-            public_graph_contexts = self.query_public_graph(entities, query, public_graph_limit)
+
+            # Encode the query once; both vector branches search with the
+            # same embedding, so paying the transformer forward per branch
+            # would be pure duplication
+            query_embedding = self._generate_query_embedding(query)
+
+            # The three branches hit independent backends (Milvus personal
+            # partition, Milvus public collection, Neo4j), so run them
+            # concurrently — total latency becomes the slowest branch
+            # instead of the sum. Each branch already swallows its own
+            # errors and returns [], so result() cannot raise here.
+            def _graph_branch():
+                entities = self._extract_legal_entities(query)
+                return self.query_public_graph(entities, query, public_graph_limit)
+
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                personal_future = executor.submit(
+                    self.query_personal_context, user_id, query, personal_top_k,
+                    query_embedding=query_embedding
+                )
+                semantic_future = executor.submit(
+                    self.query_public_semantic, query, public_semantic_top_k,
+                    query_embedding=query_embedding
+                )
+                graph_future = executor.submit(_graph_branch)
+
+                personal_contexts = personal_future.result()
+                public_semantic_contexts = semantic_future.result()
+                public_graph_contexts = graph_future.result()
             
             # Step 2: Combine and re-rank contexts
             combined_contexts = self.combine_contexts(
@@ -703,82 +999,59 @@ class SegregatedRetriever:
         try:
             if not contexts:
                 return []
-            
-            deduplicated = []
+
+            # Cheap pass: drop empties and exact case-insensitive duplicates
+            unique_contexts = []
             seen_texts = set()
-            
             for context in contexts:
                 text = context.get('text', '').strip()
-                
-                # Skip empty texts
                 if not text:
                     continue
-                
-                # Simple deduplication based on exact text match
-                text_hash = hash(text.lower())
-                if text_hash in seen_texts:
+                text_key = text.lower()
+                if text_key in seen_texts:
                     continue
-                
-                # More sophisticated similarity check for near-duplicates
-                is_duplicate = False
-                for existing_context in deduplicated:
-                    existing_text = existing_context.get('text', '').strip()
-                    
-                    # Check for substantial overlap (simple approach)
-                    if self._texts_are_similar(text, existing_text):
-                        # Keep the one with higher priority/score
-                        if (context.get('source_priority', 0) > existing_context.get('source_priority', 0) or
-                            (context.get('source_priority', 0) == existing_context.get('source_priority', 0) and
-                             context.get('score', 0) > existing_context.get('score', 0))):
-                            # Replace existing with current
-                            deduplicated.remove(existing_context)
-                            break
-                        else:
-                            # Skip current context
-                            is_duplicate = True
-                            break
-                
-                if not is_duplicate:
-                    seen_texts.add(text_hash)
-                    deduplicated.append(context)
-            
+                seen_texts.add(text_key)
+                unique_contexts.append(context)
+
+            if len(unique_contexts) < 2 or not self.embedding_model:
+                return unique_contexts
+
+            # Near-duplicate pass: one batched encode plus a BLAS
+            # similarity matrix replaces the former O(n^2) Python
+            # word-overlap loop
+            texts = [c.get('text', '')[:512] for c in unique_contexts]
+            embeddings = self.embedding_model.encode(
+                texts, batch_size=64, convert_to_numpy=True, normalize_embeddings=True
+            ).astype(np.float32, copy=False)
+            similarity = embeddings @ embeddings.T
+
+            # Greedy select in priority order so the better-ranked copy
+            # of each near-duplicate group survives
+            order = sorted(
+                range(len(unique_contexts)),
+                key=lambda i: (unique_contexts[i].get('source_priority', 0),
+                               unique_contexts[i].get('score', 0)),
+                reverse=True
+            )
+            available = np.ones(len(unique_contexts), dtype=bool)
+            kept = set()
+            for i in order:
+                if not available[i]:
+                    continue
+                kept.add(i)
+                # Suppress everything too close to the kept context
+                # (including i itself, which is already recorded)
+                available &= similarity[i] < self.DEDUP_SIMILARITY_THRESHOLD
+
+            deduplicated = [c for idx, c in enumerate(unique_contexts) if idx in kept]
+
             logger.debug(f"Deduplicated {len(contexts)} contexts to {len(deduplicated)}")
             return deduplicated
-            
+
         except Exception as e:
             logger.error(f"Error deduplicating contexts: {e}")
             return contexts
-    
-    def _texts_are_similar(self, text1: str, text2: str, threshold: float = 0.8) -> bool:
-        """
-        Check if two texts are similar based on word overlap.
-        
-        Args:
-            text1: First text
-            text2: Second text
-            threshold: Similarity threshold (0-1)
-            
-        Returns:
-            True if texts are similar above threshold
-        """
-        try:
-            # Simple word-based similarity
-            words1 = set(text1.lower().split())
-            words2 = set(text2.lower().split())
-            
-            if not words1 or not words2:
-                return False
-            
-            intersection = words1.intersection(words2)
-            union = words1.union(words2)
-            
-            similarity = len(intersection) / len(union) if union else 0
-            return similarity >= threshold
-            
-        except Exception as e:
-            logger.error(f"Error calculating text similarity: {e}")
-            return False
-    
+
     def _rerank_contexts(self, query: str, contexts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Re-rank contexts using cross-encoder for improved relevance.
@@ -797,32 +1070,44 @@ class SegregatedRetriever:
                             key=lambda x: (x.get('source_priority', 0), x.get('score', 0)), 
                             reverse=True)
             
-            # Prepare query-context pairs for cross-encoder
-            query_context_pairs = []
-            for context in contexts:
-                text = context.get('text', '')
-                if text:
-                    query_context_pairs.append([query, text])
-            
-            if not query_context_pairs:
+            # Prepare query-context pairs, remembering each pair's context
+            # index so empty-text contexts cannot shift score alignment
+            indexed_pairs = [
+                (i, [query, context.get('text', '')[:1024]])
+                for i, context in enumerate(contexts)
+                if context.get('text', '')
+            ]
+
+            if not indexed_pairs:
                 return contexts
-            
-            # Get cross-encoder scores
-            cross_encoder_scores = self.cross_encoder.predict(query_context_pairs)
-            
+
+            # Sort pairs by text length so each batch pads to its own
+            # longest member instead of the global maximum, then score
+            # everything in one batched forward pass
+            indexed_pairs.sort(key=lambda item: len(item[1][1]))
+            cross_encoder_scores = self.cross_encoder.predict(
+                [pair for _, pair in indexed_pairs],
+                batch_size=32,
+                show_progress_bar=False,
+                convert_to_numpy=True
+            )
+            score_by_index = {
+                i: float(s) for (i, _), s in zip(indexed_pairs, cross_encoder_scores)
+            }
+
             # Update contexts with cross-encoder scores
             for i, context in enumerate(contexts):
-                if i < len(cross_encoder_scores):
+                if i in score_by_index:
                     # Combine original score with cross-encoder score
                     original_score = context.get('score', 0)
-                    cross_score = float(cross_encoder_scores[i])
+                    cross_score = score_by_index[i]
                     source_priority = context.get('source_priority', 0)
-                    
+
                     # Weighted combination: 40% original, 40% cross-encoder, 20% source priority
-                    combined_score = (0.4 * original_score + 
-                                    0.4 * cross_score + 
+                    combined_score = (0.4 * original_score +
+                                    0.4 * cross_score +
                                     0.2 * source_priority)
-                    
+
                     context['cross_encoder_score'] = cross_score
                     context['combined_score'] = combined_score
                 else:
@@ -952,7 +1237,7 @@ class SegregatedRetriever:
             logger.error(f"Error getting public document count: {e}")
             return 0
     
-    def _search_public_collection(self, query_embedding: List[float], top_k: int, offset: int = 0, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
+    def _search_public_collection(self, query_embedding: np.ndarray, top_k: int, offset: int = 0, filters: Optional[Dict] = None) -> List[Dict[str, Any]]:
         """
         Search public collection with pagination support.
         
@@ -966,28 +1251,23 @@ class SegregatedRetriever:
             List of search results
         """
         try:
-            # Get public collection
-            collection = Collection(self.public_collection_name)
-            
-            # Ensure collection is loaded
-            if not collection.has_index():
-                logger.warning(f"Public collection {self.public_collection_name} has no index")
+            # Get public collection, verified and loaded once per process
+            collection = self._get_ready_collection(self.public_collection_name)
+            if collection is None:
                 return []
-            
-            collection.load()
-            
-            # Search parameters
+
+            # HNSW search: ef bounds the candidate queue; the reserved
+            # '_ef' filter key lets callers tune it per request
             search_params = {
-                "metric_type": "COSINE",
-                "params": {"nprobe": 10}
+                "metric_type": "IP",  # Cosine-equivalent on unit vectors
+                "params": {"ef": self._resolve_ef(top_k, filters)}
             }
-            
-            # Build filter expression
+
+            # Build filter expression with identifier-checked keys and
+            # escaped values ('_'-prefixed keys are search knobs)
             expr = None
             if filters:
-                expr_parts = []
-                for key, value in filters.items():
-                    expr_parts.append(f"{key} == '{value}'")
+                expr_parts = _build_filter_parts(filters)
                 if expr_parts:
                     expr = " and ".join(expr_parts)
             
@@ -999,7 +1279,7 @@ class SegregatedRetriever:
                 limit=top_k,
                 offset=offset,
                 expr=expr,
-                output_fields=["document_id", "chunk_id", "text_content", "document_type", "legal_domain", "created_at"]
+                output_fields=self._PUBLIC_OUTPUT_FIELDS
             )
             
             # Process results
@@ -100,14 +100,16 @@ class AuthService:
     def verify_otp(phone_number: str, otp_code: str) -> Dict[str, Any]:
         """Verify OTP and authenticate user"""
         try:
-            # Find valid OTP
+            # Find valid OTP; filtering expiry in SQL hits the partial
+            # index over unverified, not-yet-expired rows
             otp_obj = OTP.objects.filter(
                 phone_number=phone_number,
                 otp=otp_code,
-                is_verified=False
+                is_verified=False,
+                expires_at__gt=timezone.now()
             ).first()
             
-            if not otp_obj or not otp_obj.is_valid():
+            if not otp_obj:
                 return {'success': False, 'error': 'Invalid or expired OTP'}
             
             # Mark OTP as verified
@@ -177,8 +179,9 @@ class AIService:
     def process_hybrid_query(self, query: str, user: User, include_public: bool = True, top_k: int = 10) -> Dict[str, Any]:
         """Process hybrid query combining vector and graph search"""
         try:
-            # Generate query embedding
-            query_embedding = self.embedding_model.encode([query])[0].tolist()
+            # Generate query embedding; kept as a float32 ndarray since
+            # Milvus accepts arrays — no tolist() boxing round-trip
+            query_embedding = self.embedding_model.encode([query], convert_to_numpy=True)[0]
             
             # Vector search in Milvus
             vector_results = self.db_manager.search_vectors(
@@ -239,24 +242,25 @@ class AIService:
                 # Save message to session
                 if session_id:
                     session = ChatSession.objects.get(id=session_id, user=user)
-                    
-                    # Save user message
-                    ChatMessage.objects.create(
-                        session=session,
-                        role='user',
-                        content=message
-                    )
-                    
-                    # Save assistant response
-                    ChatMessage.objects.create(
-                        session=session,
-                        role='assistant',
-                        content=result['response']
+
+                    # Save both turn messages with one INSERT
+                    ChatMessage.objects.bulk_create([
+                        ChatMessage(
+                            session=session,
+                            role='user',
+                            content=message
+                        ),
+                        ChatMessage(
+                            session=session,
+                            role='assistant',
+                            content=result['response']
+                        ),
+                    ], batch_size=500)
+
+                    # Update session timestamp without re-writing the full row
+                    ChatSession.objects.filter(pk=session.pk).update(
+                        updated_at=timezone.now()
                     )
-                    
-                    # Update session timestamp
-                    session.updated_at = timezone.now()
-                    session.save()
             
             return result
             
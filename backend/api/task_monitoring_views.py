@@ -15,6 +15,16 @@ import json
 
 from .models import ProcessingTask, PublicDocument, UserDocument, UserPartition
 from .tasks import monitor_processing_queue
+from .utils.progress import get_task_progress
+
+
+def _live_progress(task):
+    """Prefer the Redis-published progress for in-flight tasks"""
+    if task.status == 'processing':
+        live = get_task_progress(task.task_id)
+        if live is not None:
+            return live
+    return task.progress_percentage
 
 
 @staff_member_required
@@ -207,7 +217,7 @@ def task_status(request, task_id):
             'task_id': task.task_id,
             'task_type': task.task_type,
             'status': task.status,
-            'progress_percentage': task.progress_percentage,
+            'progress_percentage': _live_progress(task),
             'processing_time_seconds': processing_time,
             'error_message': task.error_message,
             'document': document_info,
@@ -257,7 +267,7 @@ def user_task_status(request):
                 'task_id': task.task_id,
                 'task_type': task.task_type,
                 'status': task.status,
-                'progress_percentage': task.progress_percentage,
+                'progress_percentage': _live_progress(task),
                 'processing_time_seconds': processing_time,
                 'error_message': task.error_message if task.status == 'failed' else None,
                 'created_at': task.created_at.isoformat(),
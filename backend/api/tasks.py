@@ -9,6 +9,8 @@ from django.utils import timezone
 from django.core.files.storage import default_storage
 
 from .models import UserDocument, PublicDocument, ProcessingTask
+from .utils.chunks import chunked
+from .utils.progress import publish_task_progress
 from .services import DocumentService, ai_service
 from .database import connection_pool
 from .security import log_security_event
@@ -47,21 +49,23 @@ def process_user_document(self, document_id: int, force_reprocess: bool = False)
         # Update document status
         document.processing_status = 'processing'
         document.save()
-        
+        publish_task_progress(task_id, 10)
+
         # Get file path
         file_path = document.file.path if document.file else None
         if not file_path or not os.path.exists(file_path):
             raise Exception("Document file not found")
-        
+
         # Extract file type
         file_extension = os.path.splitext(file_path)[1][1:].lower()
-        
+
         # Process document
         logger.info(f"Processing document {document_id}: {document.title}")
-        
+
         content, error = DocumentService.read_file_content(file_path)
         if error:
             raise Exception(error)
+        publish_task_progress(task_id, 40)
         
         result = type('ProcessingResult', (), {
             'success': True,
@@ -77,7 +81,8 @@ def process_user_document(self, document_id: int, force_reprocess: bool = False)
         document.processed_at = timezone.now()
         document.metadata = result.metadata or {}
         document.save()
-        
+        publish_task_progress(task_id, 60)
+
         # Store in vector database
         try:
             # Get embeddings using AI service
@@ -107,7 +112,8 @@ def process_user_document(self, document_id: int, force_reprocess: bool = False)
         except Exception as e:
             logger.warning(f"Failed to store document in vector database: {str(e)}")
             # Don't fail the entire task for vector storage issues
-        
+        publish_task_progress(task_id, 80)
+
         # Store in graph database
         try:
             neo4j_manager = connection_pool.neo4j_manager
@@ -124,12 +130,13 @@ def process_user_document(self, document_id: int, force_reprocess: bool = False)
         except Exception as e:
             logger.warning(f"Failed to store document in graph database: {str(e)}")
         
-        # Update processing task
+        # Update processing task (terminal state is the only persisted tick)
         processing_task.status = 'completed'
         processing_task.progress = 100
         processing_task.completed_at = timezone.now()
         processing_task.save()
-        
+        publish_task_progress(task_id, 100)
+
         # Log success
         log_security_event(
             'document_processed',
@@ -207,21 +214,23 @@ def process_public_document(self, document_id: int, force_reprocess: bool = Fals
         # Update document status
         document.processing_status = 'processing'
         document.save()
-        
+        publish_task_progress(task_id, 10)
+
         # Get file path
         file_path = document.file.path if document.file else None
         if not file_path or not os.path.exists(file_path):
             raise Exception("Document file not found")
-        
+
         # Extract file type
         file_extension = os.path.splitext(file_path)[1][1:].lower()
-        
+
         # Process document
         logger.info(f"Processing public document {document_id}: {document.title}")
-        
+
         content, error = DocumentService.read_file_content(file_path)
         if error:
             raise Exception(error)
+        publish_task_progress(task_id, 40)
         
         result = type('ProcessingResult', (), {
             'success': True,
@@ -237,7 +246,8 @@ def process_public_document(self, document_id: int, force_reprocess: bool = Fals
         document.processed_at = timezone.now()
         document.metadata = result.metadata or {}
         document.save()
-        
+        publish_task_progress(task_id, 60)
+
         # Store in vector database (public collection)
         try:
             # Get embeddings using AI service
@@ -267,7 +277,8 @@ def process_public_document(self, document_id: int, force_reprocess: bool = Fals
             
         except Exception as e:
             logger.warning(f"Failed to store public document in vector database: {str(e)}")
-        
+        publish_task_progress(task_id, 80)
+
         # Store in graph database
         try:
             neo4j_manager = connection_pool.neo4j_manager
@@ -284,12 +295,13 @@ def process_public_document(self, document_id: int, force_reprocess: bool = Fals
         except Exception as e:
             logger.warning(f"Failed to store public document in graph database: {str(e)}")
         
-        # Update processing task
+        # Update processing task (terminal state is the only persisted tick)
         processing_task.status = 'completed'
         processing_task.progress = 100
         processing_task.completed_at = timezone.now()
         processing_task.save()
-        
+        publish_task_progress(task_id, 100)
+
         logger.info(f"Successfully processed public document {document_id}")
         return {
             'status': 'success',
@@ -458,14 +470,23 @@ def monitor_processing_queue():
         )
         
         stuck_count = 0
-        for task in stuck_tasks:
+        stuck_batch = []
+        for task in chunked(stuck_tasks):
             # Mark as failed and log
             task.status = 'failed'
             task.error_message = 'Task stuck in processing state'
-            task.save()
-            
+            stuck_batch.append(task)
+
             logger.warning(f"Marked stuck task {task.id} as failed")
             stuck_count += 1
+
+            # Flush as multi-row UPDATEs instead of one statement per task
+            if len(stuck_batch) >= 500:
+                ProcessingTask.objects.bulk_update(stuck_batch, fields=['status', 'error_message'])
+                stuck_batch = []
+
+        if stuck_batch:
+            ProcessingTask.objects.bulk_update(stuck_batch, fields=['status', 'error_message'])
         
         # Get queue statistics
         stats = {
@@ -418,7 +418,11 @@ def delete_user_document(request, document_id):
         # TODO: Remove document embeddings from user partition
         # This would be implemented when Milvus integration is complete
         
-        # Delete document (will cascade to processing tasks)
+        # Wipe dependent tasks with one DELETE so the cascade collector
+        # doesn't have to fetch and fan out over them row by row
+        ProcessingTask.objects.filter(user_document=document).delete()
+
+        # Delete document
         document.delete()
         
         # Update user partition document count
@@ -0,0 +1,33 @@
+"""
+Constant-memory iteration helpers for large querysets.
+Avoids materializing whole tables when walking maintenance/export loops.
+"""
+
+
+def chunked(queryset, size=1000):
+    """
+    Iterate a queryset in primary-key-ordered batches of `size`.
+
+    Unlike `for obj in queryset`, which loads every row into memory at
+    once, this pages through the table with `pk > last_seen` range scans,
+    so memory stays bounded no matter how large the table grows. Safe to
+    use in loops that mutate or delete the yielded rows, since each batch
+    is a fresh query.
+
+    Args:
+        queryset: Base queryset to iterate (any filters/select_related kept)
+        size: Rows fetched per batch
+
+    Yields:
+        Model instances in primary-key order
+    """
+    ordered = queryset.order_by('pk')
+    last_pk = None
+
+    while True:
+        batch = ordered.filter(pk__gt=last_pk) if last_pk is not None else ordered
+        rows = list(batch[:size])
+        if not rows:
+            return
+        yield from rows
+        last_pk = rows[-1].pk
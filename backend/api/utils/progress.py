@@ -0,0 +1,54 @@
+"""
+Task progress reporting over Redis.
+
+Intermediate progress ticks live in Redis pub/sub plus a short-lived key
+instead of row UPDATEs on processing_tasks, so a task that reports 100
+ticks costs zero database writes. Only terminal states (completed/failed)
+are persisted to the ProcessingTask row by the task itself.
+"""
+
+import logging
+
+import redis
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_progress_redis = None
+
+
+def _get_progress_redis():
+    global _progress_redis
+    if _progress_redis is None:
+        _progress_redis = redis.from_url(settings.REDIS_URL)
+    return _progress_redis
+
+
+def publish_task_progress(task_id, percentage):
+    """
+    Publish a progress tick to the task's Redis channel and keep the
+    latest value readable for an hour. Best-effort: progress is cosmetic,
+    so Redis being down must never fail the task.
+
+    Args:
+        task_id: Celery task id the dashboards key on
+        percentage: Integer progress 0-100
+    """
+    try:
+        key = f"task:{task_id}:progress"
+        client = _get_progress_redis()
+        with client.pipeline(transaction=False) as pipe:
+            pipe.publish(key, percentage)
+            pipe.setex(key, 3600, percentage)
+            pipe.execute()
+    except Exception as e:
+        logger.warning(f"Failed to publish progress for task {task_id}: {str(e)}")
+
+
+def get_task_progress(task_id):
+    """Read the last published progress for a task; None on miss."""
+    try:
+        raw = _get_progress_redis().get(f"task:{task_id}:progress")
+        return int(raw) if raw is not None else None
+    except Exception:
+        return None
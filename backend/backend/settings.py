@@ -298,6 +298,21 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_ENABLE_UTC = True
 
+# Document processing (extraction, chunking, embedding) is CPU-bound and
+# GIL-bound, so workers must use the prefork pool for real parallelism;
+# a thread pool caps throughput at one core.
+CELERY_WORKER_POOL = 'prefork'
+CELERY_WORKER_CONCURRENCY = int(os.environ.get('CELERY_WORKER_CONCURRENCY', os.cpu_count() or 4))
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1  # CPU tasks are long; don't hoard
+
+# Route CPU-heavy document tasks to a dedicated queue so they can be
+# scaled independently of the default (IO/maintenance) workers
+CELERY_TASK_ROUTES = {
+    'api.tasks.process_user_document': {'queue': 'embedding'},
+    'api.tasks.process_public_document': {'queue': 'embedding'},
+    'api.tasks.batch_process_documents': {'queue': 'embedding'},
+}
+
 # Celery Beat Schedule
 CELERY_BEAT_SCHEDULE = {
     'cleanup-expired-sessions': {